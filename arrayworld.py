@@ -0,0 +1,119 @@
+import hashlib  # Import hashlib to fingerprint the simulation state
+import random  # Import random to seed the numpy generator from the game's random stream
+import struct  # Import struct to pack the state into bytes for hashing
+import pygame  # Import pygame for sprite groups and drawing
+from constants import *  # Import constants (screen size is used to place the player)
+from player import *  # Import the Player class
+from asteroidfield import *  # Import the AsteroidField class
+from assets import registry  # Import the shared asset registry for the shot image
+from entitystore import *  # Import the array-backed entity store and its vectorized helpers
+from profiler import NullProfiler  # Import the do-nothing profiler used unless one is attached
+
+# ArrayWorld is the array-backed version of World: asteroids and shots live in EntityStores
+# and are moved, collided and split with vectorized NumPy operations instead of per-sprite updates
+# It has the same step/draw interface as World, so the headless runner can use either one
+class ArrayWorld:
+
+    # Constructor to set up the entity stores and create the starting objects
+    def __init__(self, capacity=1024):
+        self.asteroids = EntityStore(capacity)  # Array store for asteroids
+        self.shots = EntityStore(capacity)  # Array store for shots
+        self.rng = np.random.default_rng(random.getrandbits(64))  # Split angles, seeded from the game's random stream
+
+        # The player and asteroid field are still sprites, but they only ever append to the stores
+        self.updatable = pygame.sprite.Group()
+        self.drawable = pygame.sprite.Group()
+        AsteroidField.containers = self.updatable
+        self.asteroid_field = AsteroidField(self.asteroids)
+        Player.containers = (self.updatable, self.drawable)
+        self.player = Player(SCREEN_WIDTH / 2, SCREEN_HEIGHT / 2)  # Create the player at the center of the screen
+        self.player.shot_store = self.shots
+
+        self.score = 0  # Number of asteroids hit so far
+        self.frame = 0  # Number of steps simulated so far
+        self.elapsed = 0.0  # Simulated time in seconds
+        self.game_over = False  # Set once an asteroid hits the player
+        self.profiler = NullProfiler()  # Replace with a FrameProfiler to time the update and collision phases
+
+    # Advance the simulation by one step using the given InputState and delta time
+    def step(self, inputs, dt):
+        if self.game_over:  # Nothing moves once the player is dead
+            return
+
+        self.player.controls = inputs  # Hand the controls for this step to the player
+
+        # Move every asteroid and shot, then let the player and field queue new entities
+        # (new entities are appended after the move, like a sprite created during the update loop)
+        with self.profiler.phase("update"):
+            self.asteroids.integrate(dt)
+            self.shots.integrate(dt)
+            for obj in self.updatable:
+                obj.update(dt)
+            self.asteroids.flush()
+            self.shots.flush()
+
+        with self.profiler.phase("collision"):
+            # Check for collisions between the player and asteroids
+            player = self.player
+            if len(overlapping(self.asteroids, player.position.x, player.position.y, player.radius)):
+                self.game_over = True
+                return
+
+            # Check for collisions between shots and asteroids, then remove and split the hit ones in one batch
+            asteroid_slots, shot_slots = find_hits(self.asteroids, self.shots)
+            if len(asteroid_slots):
+                self.score += len(asteroid_slots)
+                self.shots.kill(shot_slots)
+                split_batch(self.asteroids, asteroid_slots, self.rng)
+
+        # Despawn shots and asteroids that left the screen, outlived their lifetime or exceed their store's cap
+        with self.profiler.phase("cull"):
+            self.shots.cull(SHOT_MAX_LIFETIME, MAX_SHOTS)
+            self.asteroids.cull(ASTEROID_MAX_LIFETIME, MAX_ASTEROIDS)
+
+        self.frame += 1
+        self.elapsed += dt
+
+    # Fingerprint of the simulation state (score, player, asteroids and shots) as a 64-bit integer
+    # Two runs with the same seed, inputs and dts must produce the same hash at the same frame
+    def state_hash(self):
+        digest = hashlib.blake2b(digest_size=8)
+        player = self.player
+        digest.update(struct.pack("<qq3d", self.frame, self.score, player.position.x, player.position.y, player.rotation))
+        for store in (self.asteroids, self.shots):
+            slots = store.live()
+            digest.update(store.positions[slots].tobytes())
+            digest.update(store.velocities[slots].tobytes())
+            digest.update(store.radii[slots].tobytes())
+        return int.from_bytes(digest.digest(), "little")
+
+    # Number of live entities in each store (used to check memory stays flat on long runs)
+    def entity_counts(self):
+        return {
+            "updatable": len(self.updatable),
+            "drawable": len(self.drawable),
+            "asteroids": len(self.asteroids),
+            "shots": len(self.shots),
+        }
+
+    # Draw the player, every asteroid and every shot onto the given surface
+    # alpha interpolates between the previous and current step (1.0 draws the current positions)
+    # Returns the list of rects that were drawn over
+    def draw(self, screen, alpha=1.0):
+        rects = []
+        for obj in self.drawable:
+            rects.append(obj.draw(screen, alpha))
+
+        slots = self.asteroids.live()
+        for slot, (x, y) in zip(slots, self.asteroids.render_positions(slots, alpha)):
+            rects.append(pygame.draw.circle(screen, "white", (x, y), self.asteroids.radii[slot], 2))
+
+        # Shots face their direction of travel, matching Shot's angle_to(Vector2(0, -1))
+        rotations = registry.rotations("Projectile_1_Blue_Small")
+        slots = self.shots.live()
+        velocities = self.shots.velocities[slots]
+        angles = -90 - np.degrees(np.arctan2(velocities[:, 1], velocities[:, 0]))
+        for position, angle in zip(self.shots.render_positions(slots, alpha), angles):
+            image = rotations.frame(angle)
+            rects.append(screen.blit(image, image.get_rect(center=tuple(position))))
+        return [rect for rect in rects if rect]  # Skip anything drawn entirely off screen
@@ -0,0 +1,140 @@
+import os  # Import os for source file stamps and the atomic rename
+import mmap  # Import mmap to map the cache file instead of reading it
+import struct  # Import struct for the binary cache layout
+import sys  # Import sys for the command line exit code
+import pygame  # Import pygame for decoding, scaling and converting surfaces
+from constants import *  # Import constants (ASSET_CACHE_FILE is the default cache path)
+
+# Cache file layout (little endian):
+#   header: magic b"ASTC", version (u16), display bit depth (u8), entry count (u32), display masks (4 x u32)
+#   then one index entry per image: name (32 bytes), width, height (u16), pitch (u32), data offset (u64),
+#     alpha (u8), bit depth (u8), masks (4 x u32), and the source file's size (u64) and modification time (f64)
+#   then the pixel data, each image starting on a page boundary so it can be mapped straight into a Surface
+MAGIC = b"ASTC"
+VERSION = 1
+HEADER = struct.Struct("<4sHBI4I")
+ENTRY = struct.Struct("<32sHHIQBB4IQd")
+
+# Masks of the surface pygame.image.frombuffer(..., "BGRA") creates (also what convert_alpha() gives on 32-bit displays)
+BGRA_MASKS = (0xFF0000, 0xFF00, 0xFF, 0xFF000000)
+
+# Round an offset up to the next page boundary
+def page_align(offset):
+    return (offset + mmap.PAGESIZE - 1) // mmap.PAGESIZE * mmap.PAGESIZE
+
+# Bit depth and masks of the display (a cache only holds screen-ready pixels for the format it was built with)
+def display_format():
+    screen = pygame.display.get_surface()
+    return screen.get_bitsize(), tuple(screen.get_masks())
+
+# Size and modification time of a source file, used to spot cache entries that are out of date
+def source_stamp(path):
+    info = os.stat(path)
+    return info.st_size, info.st_mtime
+
+# Preprocess images into a cache file: decode, scale and convert each one to the display's pixel format once
+# images maps name -> (source path, (width, height), alpha); a display mode must be set
+def write_asset_cache(path, images):
+    bitsize, masks = display_format()
+    entries = []  # Packed index entries
+    blobs = []  # (offset, pixel bytes) to write after the index
+    offset = page_align(HEADER.size + ENTRY.size * len(images))
+    for name, (source, size, alpha) in images.items():
+        surface = pygame.transform.scale(pygame.image.load(source), size)
+        surface = surface.convert_alpha() if alpha else surface.convert()
+        data = surface.get_buffer().raw
+        entries.append(ENTRY.pack(
+            name.encode(), size[0], size[1], surface.get_pitch(), offset, alpha,
+            surface.get_bitsize(), *surface.get_masks(), *source_stamp(source),
+        ))
+        blobs.append((offset, data))
+        offset = page_align(offset + len(data))
+
+    # Write a temporary file and rename it, so a game starting meanwhile never maps a half-written cache
+    temporary = path + ".tmp"
+    with open(temporary, "wb") as cache_file:
+        cache_file.write(HEADER.pack(MAGIC, VERSION, bitsize, len(entries), *masks))
+        for entry in entries:
+            cache_file.write(entry)
+        for offset, data in blobs:
+            cache_file.seek(offset)
+            cache_file.write(data)
+    os.replace(temporary, path)
+
+# AssetCache maps a cache file written by write_asset_cache and hands out its surfaces
+# Pages are only read from disk when they are first drawn, and are shared with the OS file cache
+class AssetCache:
+
+    # Constructor to map the file and read its index
+    # Raises ValueError (with the file unmapped again) if it is not a complete cache of this version
+    def __init__(self, path):
+        with open(path, "rb") as cache_file:
+            if os.fstat(cache_file.fileno()).st_size < HEADER.size:  # Also rules out an empty file, which mmap refuses
+                raise ValueError(f"{path} is too short to be an asset cache")
+            # Copy-on-write: surfaces can point into the mapping without the file ever being modified
+            self.map = mmap.mmap(cache_file.fileno(), 0, access=mmap.ACCESS_COPY)
+        try:
+            self.read_index(path)
+        except (ValueError, struct.error, UnicodeDecodeError) as error:
+            self.close()
+            raise ValueError(f"{path} is not a usable asset cache: {error}") from error
+
+    # Read the header and index, checking that everything they point at lies inside the file
+    def read_index(self, path):
+        size = len(self.map)
+        magic, version, bitsize, count, *masks = HEADER.unpack_from(self.map, 0)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"not a version {VERSION} asset cache")
+        if HEADER.size + count * ENTRY.size > size:
+            raise ValueError(f"index of {count} entries is cut off")
+        self.format = (bitsize, tuple(masks))  # Display format the cache was built for
+        self.entries = {}  # Maps image name to (width, height, pitch, offset, alpha, bit depth, masks, source stamp)
+        for index in range(count):
+            name, width, height, pitch, offset, alpha, depth, *rest = ENTRY.unpack_from(self.map, HEADER.size + index * ENTRY.size)
+            name = name.rstrip(b"\0").decode()
+            if offset + pitch * height > size:
+                raise ValueError(f"pixel data for {name} is cut off")
+            self.entries[name] = (width, height, pitch, offset, bool(alpha), depth, tuple(rest[:4]), tuple(rest[4:]))
+
+    # Unmap the file (before it is replaced, which Windows refuses while it is mapped)
+    # Only valid while none of its surfaces are in use, since alpha surfaces point into the mapping
+    def close(self):
+        self.map.close()
+
+    # Whether the cache matches the current display format and every image's source file, size and alpha
+    def is_fresh(self, images):
+        if self.format != display_format():
+            return False
+        for name, (source, size, alpha) in images.items():
+            entry = self.entries.get(name)
+            if entry is None or entry[:2] != tuple(size) or entry[4] != alpha or entry[7] != source_stamp(source):
+                return False
+        return True
+
+    # Get a screen-ready Surface for a cached image (None if its rows are padded and can't be used directly)
+    # Alpha images in BGRA layout share the mapped pages; anything else is copied once into a Surface in the cached
+    # format, because a mapped opaque image could only be wrapped as BGRA and would then be alpha-blended on every blit
+    def surface(self, name):
+        width, height, pitch, offset, alpha, depth, masks, stamp = self.entries[name]
+        if pitch != width * depth // 8:
+            return None
+        data = memoryview(self.map)[offset:offset + pitch * height]
+        if alpha and depth == 32 and masks == BGRA_MASKS:
+            return pygame.image.frombuffer(data, (width, height), "BGRA")
+        surface = pygame.Surface((width, height), pygame.SRCALPHA if alpha else 0, depth, masks)
+        memoryview(surface.get_view("1")).cast("B")[:] = data
+        return surface
+
+# Command line entry point: build the cache ahead of time (e.g. when installing on a cabinet)
+# The game builds it on first start too, but doing it here keeps that work out of the first launch
+def main():
+    from assets import SCREEN_IMAGE_FILES  # Imported here because assets imports this module
+    pygame.display.init()
+    pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))  # Surfaces are converted to this display's format
+    path = sys.argv[1] if len(sys.argv) > 1 else ASSET_CACHE_FILE
+    write_asset_cache(path, SCREEN_IMAGE_FILES)
+    print(f"Wrote {len(SCREEN_IMAGE_FILES)} images to {path} ({os.path.getsize(path) / 1024:.1f} KiB)")
+
+# Build the cache if this script is executed directly
+if __name__ == "__main__":
+    main()
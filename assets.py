@@ -0,0 +1,169 @@
+import os  # Import os for building asset file paths
+import time  # Import time to measure how long each asset takes to load
+import struct  # Import struct to recognise a cache whose layout cannot be unpacked
+import pygame  # Import pygame for loading images and sounds
+from constants import *  # Import constants (screen size and the asset cache path)
+from rotationatlas import RotationAtlas  # Import the pre-rendered rotation cache
+from assetcache import AssetCache, write_asset_cache  # Import the preprocessed image cache
+
+# Images used by the game sprites, keyed by the name the game code asks for
+IMAGE_FILES = {
+    "Blue_Player_Ship_1": os.path.join("images", "Blue_Player_Ship_1.png"),
+    "Projectile_1_Blue_Small": os.path.join("images", "Projectile_1_Blue_Small.png"),
+}
+
+# Backdrop and UI images: name -> (path, size they are drawn at, whether they have an alpha channel)
+# These are stored screen-ready in the asset cache instead of being decoded and scaled on every start
+SCREEN_IMAGE_FILES = {
+    "backdrop": (os.path.join("images", "A_CompleteSpaceBackground.png"), (SCREEN_WIDTH, SCREEN_HEIGHT), False),
+    "score_box": (os.path.join("images", "list_box.png"), (200, 50), True),
+}
+
+# Sound effects used by the game sprites
+SOUND_FILES = {
+    "PlayerFire": os.path.join("sounds", "PlayerFire.wav"),
+    "PlayerExplode": os.path.join("sounds", "PlayerExplode.wav"),
+    "EnemyExplode": os.path.join("sounds", "EnemyExplode.wav"),
+}
+
+# Background music tracks, streamed from disk by the audio manager rather than decoded up front
+MUSIC_FILES = [
+    os.path.join("sounds", "SongA.wav"),
+    os.path.join("sounds", "SongB.wav"),
+    os.path.join("sounds", "SongC.wav"),
+]
+
+# AssetRegistry loads every image and sound once and hands out shared handles to them
+class AssetRegistry:
+
+    # Constructor to initialize an empty registry
+    def __init__(self):
+        self.images = {}  # Maps asset name to a loaded (and, when possible, converted) Surface
+        self.sounds = {}  # Maps asset name to a decoded Sound (or None when audio is unavailable)
+        self.atlases = {}  # Maps image name to its RotationAtlas
+        self.cache = None  # AssetCache the screen images were mapped from (kept open while its surfaces are in use)
+        self.stats = {}  # Maps asset name to a dict with its kind, load time and memory use
+
+    # Load every known game image and sound up front so nothing is read from disk mid-frame
+    def preload(self):
+        for name, path in IMAGE_FILES.items():
+            self.load_image(name, path)
+        for name, path in SOUND_FILES.items():
+            self.load_sound(name, path)
+        for name in IMAGE_FILES:  # Sprite images are drawn rotated, so pre-render their angles too
+            self.rotations(name)
+
+    # Load an image from disk, optionally scale it, and convert it to the display's pixel format
+    # Opaque images (alpha=False) use convert() instead, which blits faster
+    def load_image(self, name, path, size=None, alpha=True):
+        start = time.perf_counter()
+        surface = pygame.image.load(path)
+        if size is not None:  # Scale once here instead of every time it is used
+            surface = pygame.transform.scale(surface, size)
+        if pygame.display.get_surface() is not None:  # Converting needs a display mode to be set
+            surface = surface.convert_alpha() if alpha else surface.convert()
+        self.images[name] = surface
+        self.stats[name] = {
+            "kind": "image",
+            "seconds": time.perf_counter() - start,
+            "bytes": surface.get_pitch() * surface.get_height(),
+        }
+        return surface
+
+    # Get the backdrop and UI images from the asset cache, preprocessing them into it first if the cache
+    # is missing or out of date (the cache holds display-format pixels, so a display mode must be set)
+    def load_screen_images(self, path=ASSET_CACHE_FILE):
+        start = time.perf_counter()
+        cache = None
+        if os.path.exists(path):
+            try:
+                cache = AssetCache(path)
+            except (ValueError, struct.error):  # Truncated, corrupt or from another version, rebuild it
+                cache = None
+        if cache is None or not cache.is_fresh(SCREEN_IMAGE_FILES):
+            if cache is not None:  # Release the stale mapping before the file is replaced
+                cache.close()
+            write_asset_cache(path, SCREEN_IMAGE_FILES)
+            cache = AssetCache(path)
+        self.cache = cache
+        self.stats["asset cache"] = {"kind": "cache", "seconds": time.perf_counter() - start, "bytes": 0}
+
+        for name, (source, size, alpha) in SCREEN_IMAGE_FILES.items():
+            start = time.perf_counter()
+            surface = cache.surface(name)
+            if surface is None:  # Layout the cache can't hand out directly, load it the slow way
+                self.load_image(name, source, size, alpha)
+                continue
+            self.images[name] = surface
+            self.stats[name] = {
+                "kind": "cached",
+                "seconds": time.perf_counter() - start,
+                "bytes": surface.get_pitch() * surface.get_height(),
+            }
+
+    # Load and decode a sound from disk (stores None if the mixer is not running)
+    def load_sound(self, name, path):
+        start = time.perf_counter()
+        mixer_format = pygame.mixer.get_init()  # (frequency, format, channels) or None
+        if mixer_format is None:
+            self.sounds[name] = None
+            return None
+        sound = pygame.mixer.Sound(path)
+        frequency, sample_format, channels = mixer_format
+        self.sounds[name] = sound
+        self.stats[name] = {
+            "kind": "sound",
+            "seconds": time.perf_counter() - start,
+            "bytes": int(sound.get_length() * frequency) * channels * (abs(sample_format) // 8),
+        }
+        return sound
+
+    # Get the shared Surface for an image, loading it on first use if it was not preloaded
+    def image(self, name):
+        if name not in self.images:
+            if name in SCREEN_IMAGE_FILES:  # Without the cache, decode and scale it from the source file
+                self.load_image(name, *SCREEN_IMAGE_FILES[name])
+            else:
+                self.load_image(name, IMAGE_FILES[name])
+        return self.images[name]
+
+    # Get the shared RotationAtlas for an image, building it once on first use
+    def rotations(self, name):
+        if name not in self.atlases:
+            start = time.perf_counter()
+            atlas = RotationAtlas(self.image(name))
+            self.atlases[name] = atlas
+            self.stats[name + " (rotations)"] = {
+                "kind": "atlas",
+                "seconds": time.perf_counter() - start,
+                "bytes": atlas.byte_size(),
+            }
+        return self.atlases[name]
+
+    # Get the shared Sound for a sound effect, loading it on first use if it was not preloaded
+    def sound(self, name):
+        if name not in self.sounds:
+            self.load_sound(name, SOUND_FILES[name])
+        return self.sounds[name]
+
+    # Build a list of (name, kind, milliseconds, kilobytes) rows, slowest load first
+    def report(self):
+        rows = [
+            (name, stat["kind"], stat["seconds"] * 1000, stat["bytes"] / 1024)
+            for name, stat in self.stats.items()
+        ]
+        rows.sort(key=lambda row: row[2], reverse=True)
+        return rows
+
+    # Print the load report so startup time and memory can be budgeted
+    def print_report(self):
+        total_ms = 0.0
+        total_kb = 0.0
+        for name, kind, ms, kb in self.report():
+            print(f"{name:<28} {kind:<6} {ms:8.2f} ms {kb:10.1f} KiB")
+            total_ms += ms
+            total_kb += kb
+        print(f"{'total':<28} {'':<6} {total_ms:8.2f} ms {total_kb:10.1f} KiB")
+
+# The shared registry used by every game object
+registry = AssetRegistry()
@@ -1,7 +1,7 @@
 import random  # Import random module for random number generation
 from circleshape import *  # Import base class CircleShape
 from constants import *  # Import constants used in the game
-from pygame.mixer import Sound  # Import Sound class for handling sound effects
+from audio import audio_manager  # Import the shared audio manager for sound effects
 
 # Asteroid class, derived from the CircleShape class
 class Asteroid(CircleShape):
@@ -10,26 +10,25 @@ class Asteroid(CircleShape):
     def __init__(self, x, y, radius):
         # Call the parent (CircleShape) constructor to initialize position, velocity, and radius
         super().__init__(x, y, radius)
-        
-        # Create a new channel for asteroid sound effects
-        self.channel = pygame.mixer.Channel(3)
-        # Load the explosion sound for when the asteroid is destroyed or split
-        self.sound = Sound("sounds/EnemyExplode.wav")
 
     # Method to draw the asteroid on the screen
-    def draw(self, screen):
-        # Draw the asteroid as a white circle with the specified radius at its position
-        pygame.draw.circle(screen, "white", self.position, self.radius, 2)
+    def draw(self, screen, alpha=1.0):
+        # Draw the asteroid as a white circle with the specified radius at its (interpolated) position
+        # Returns the rect that was drawn over (used by the dirty-rect renderer)
+        return pygame.draw.circle(screen, "white", self.render_position(alpha), self.radius, 2)
 
     # Method to update the asteroid's position based on its velocity
     def update(self, dt):
         # Update the position by moving it in the direction of its velocity
-        self.position += self.velocity * dt
+        # The old Vector2 is kept as the previous position (for interpolated drawing) instead of copying it
+        self.previous_position = self.position
+        self.position = self.position + self.velocity * dt
+        self.age += dt  # Track how long the asteroid has been alive
 
     # Method to split the asteroid into smaller asteroids
     def split(self):
-        # Play the explosion sound when the asteroid is split
-        self.channel.play(self.sound)
+        # Queue the explosion sound when the asteroid is split (simultaneous explosions share the explosion voices)
+        audio_manager.play("EnemyExplode", "explosion")
         # Remove the current asteroid (destroy it)
         self.kill()
         
@@ -47,10 +46,13 @@ class Asteroid(CircleShape):
         # Decrease the radius of the new asteroids
         new_radius = self.radius - ASTEROID_MIN_RADIUS
 
+        # Copy the position now: this asteroid is already back in the pool and may be reused below
+        x, y = self.position
+
         # Create the first new asteroid with a modified velocity
-        asteroid1 = Asteroid(self.position.x, self.position.y, new_radius)
-        asteroid1.velocity = spawn_vector1 * 1.2  # Increase the velocity slightly for the new asteroid
+        asteroid1 = Asteroid.create(x, y, new_radius)
+        asteroid1.velocity.update(spawn_vector1 * 1.2)  # Increase the velocity slightly for the new asteroid
 
         # Create the second new asteroid with a different velocity
-        asteroid2 = Asteroid(self.position.x, self.position.y, new_radius)
-        asteroid2.velocity = spawn_vector2 * 1.2  # Increase the velocity slightly for the new asteroid
+        asteroid2 = Asteroid.create(x, y, new_radius)
+        asteroid2.velocity.update(spawn_vector2 * 1.2)  # Increase the velocity slightly for the new asteroid
@@ -1,4 +1,7 @@
 import pygame  # Import pygame library for game development
+import os  # Import os to find the wave file next to the game's modules
+import json  # Import json to read the wave definitions
+import math  # Import math for the turn table
 import random  # Import random module for generating random values
 from asteroid import Asteroid  # Import the Asteroid class from asteroid.py
 from constants import *  # Import constants for the game (such as screen dimensions, spawn rates, etc.)
@@ -30,39 +33,150 @@ class AsteroidField(pygame.sprite.Sprite):
     ]
 
     # Constructor to initialize the AsteroidField object
-    def __init__(self):
+    # If store is an EntityStore, asteroids are queued into it instead of being created as sprites
+    # waves is a wave schedule dict (see load_waves); by default it is read from WAVES_FILE
+    def __init__(self, store=None, waves=None):
         pygame.sprite.Sprite.__init__(self, self.containers)  # Initialize the sprite using containers from the parent class
-        self.spawn_timer = 0.0  # Timer to control asteroid spawning
+        self.spawn_timer = 0.0  # Time carried over towards the next spawn tick
+        self.store = store  # Array-backed entity store, or None for sprite asteroids
+        self.schedule = validate_waves(waves, "waves") if waves is not None else load_waves(WAVES_FILE)
+        self.wave_index = 0  # Index of the current wave in the schedule
+        self.wave_time = 0.0  # Time spent in the current wave
+        self.batch = []  # Pre-generated (radius, x, y, vx, vy) spawns for the current wave, next one last
+        self.turns = {}  # Maps a whole-degree turn to its (cos, sin), built once per angle used
 
-    # Method to spawn a new asteroid with given radius, position, and velocity
-    def spawn(self, radius, position, velocity):
-        asteroid = Asteroid(position.x, position.y, radius)  # Create a new Asteroid object
-        asteroid.velocity = velocity  # Set the asteroid's velocity
-        # You would likely need to add the asteroid to a group here to manage it (e.g., `self.containers.add(asteroid)`)
+    # The wave currently being spawned
+    def wave(self):
+        return self.schedule["waves"][self.wave_index]
 
-    # Update method called each frame to handle asteroid spawning and movement
-    def update(self, dt):
-        self.spawn_timer += dt  # Increase the spawn timer by the time elapsed since the last frame
-        if self.spawn_timer > ASTEROID_SPAWN_RATE:  # Check if it's time to spawn a new asteroid
-            self.spawn_timer = 0  # Reset the spawn timer
+    # Seconds between spawn ticks in the current wave (ASTEROID_SPAWN_RATE unless the wave sets its own)
+    def interval(self):
+        interval = self.wave().get("interval")
+        return ASTEROID_SPAWN_RATE if interval is None else interval
+
+    # Move on to the next wave once the current one has run for its duration (time left over carries into it)
+    def advance_wave(self):
+        waves = self.schedule["waves"]
+        while True:
+            duration = self.wave().get("duration")
+            if duration is None or self.wave_time < duration:
+                return
+            if self.wave_index + 1 == len(waves) and not self.schedule.get("loop", False):
+                return  # Stay on the last wave
+            self.wave_time -= duration
+            self.wave_index = (self.wave_index + 1) % len(waves)
+            self.batch = []  # The new wave may spawn differently, throw away parameters made for the old one
+            self.spawn_timer = min(self.spawn_timer, self.interval())  # Time saved up under a slower wave must not burst out at once
+
+    # Generate the next SPAWN_BATCH_SIZE spawns for the current wave in one go
+    # Each kind of random value is drawn for the whole batch in a single call, and positions and velocities
+    # are worked out as plain numbers (no Vector2 per spawn), so a batch costs little more than one spawn did
+    def generate_batch(self):
+        wave = self.wave()
+        kinds = wave.get("kinds") or range(1, ASTEROID_KINDS + 1)
+        low, high = wave.get("speed", (40, 100))
+        spread = wave.get("spread", 30)
 
-            # Randomly choose one of the screen edges to spawn the asteroid from
-            edge = random.choice(self.edges)
+        # Each edge spawns along a line: origin + axis * offset (offset in 0..1), moving along direction
+        # The edge's position function is sampled at both ends so it is still read with the current constants
+        edges = []
+        for index in wave.get("edges", range(len(self.edges))):
+            direction, place = self.edges[index]
+            origin = place(0)
+            axis = place(1) - origin
+            edges.append((origin.x, origin.y, axis.x, axis.y, direction.x, direction.y))
 
-            # Generate a random speed for the asteroid's velocity (between 40 and 100)
-            speed = random.randint(40, 100)
+        count = SPAWN_BATCH_SIZE
+        chosen_edges = random.choices(edges, k=count)
+        speeds = random.choices(range(low, high + 1), k=count)
+        angles = random.choices(range(-spread, spread + 1), k=count)
+        chosen_kinds = random.choices(kinds, k=count)
+        bits = random.getrandbits(32 * count)  # One 32-bit fraction per spawn for its place along the edge
+        offsets = [(bits >> shift & 0xFFFFFFFF) / 4294967296 for shift in range(0, 32 * count, 32)]
 
-            # Calculate the velocity by multiplying the direction vector by the speed
-            velocity = edge[0] * speed
+        batch = []
+        for (x, y, axis_x, axis_y, dx, dy), speed, angle, offset, kind in zip(chosen_edges, speeds, angles, offsets, chosen_kinds):
+            if angle not in self.turns:
+                radians = math.radians(angle)
+                self.turns[angle] = (math.cos(radians), math.sin(radians))
+            cos, sin = self.turns[angle]
+            # Rotate the direction by angle degrees the way Vector2.rotate() does, then scale it to the speed
+            batch.append((
+                ASTEROID_MIN_RADIUS * kind,
+                x + axis_x * offset,
+                y + axis_y * offset,
+                (dx * cos - dy * sin) * speed,
+                (dx * sin + dy * cos) * speed,
+            ))
+        batch.reverse()  # Spawns are popped from the end
+        self.batch = batch
 
-            # Apply a small random rotation to the velocity to add variation in direction
-            velocity = velocity.rotate(random.randint(-30, 30))
+    # Method to spawn a new asteroid with given radius, position, and velocity
+    def spawn(self, radius, position, velocity):
+        self.spawn_at(radius, position.x, position.y, velocity.x, velocity.y)
+
+    # Spawn an asteroid from plain numbers (what the pre-generated batch holds)
+    def spawn_at(self, radius, x, y, vx, vy):
+        if self.store is not None:  # Array engine: queue it, the store appends all spawns of a step as one batch
+            self.store.append(x, y, vx, vy, radius)
+            return
+        asteroid = Asteroid.create(x, y, radius)  # Create (or recycle) an Asteroid object
+        asteroid.velocity.update(vx, vy)  # Set the asteroid's velocity
+
+    # Update method called each frame to handle asteroid spawning
+    # Time is accumulated rather than reset, so a long frame spawns the ticks it covered (up to SPAWN_CATCHUP_LIMIT)
+    def update(self, dt):
+        self.wave_time += dt
+        self.advance_wave()
+        self.spawn_timer += dt  # Add the time elapsed since the last frame
 
-            # Generate the spawn position along the chosen edge (between 0 and 1 for randomness)
-            position = edge[1](random.uniform(0, 1))
+        interval = self.interval()
+        ticks = 0
+        while self.spawn_timer >= interval:  # One spawn tick for every interval that has passed
+            self.spawn_timer -= interval
+            ticks += 1
+            if ticks > SPAWN_CATCHUP_LIMIT:  # After a very long stall, drop the backlog instead of flooding the screen
+                self.spawn_timer = 0.0
+                break
+            for _ in range(self.wave().get("burst", 1)):
+                if not self.batch:
+                    self.generate_batch()
+                self.spawn_at(*self.batch.pop())
 
-            # Randomly choose a type of asteroid based on predefined kinds
-            kind = random.randint(1, ASTEROID_KINDS)
+# Read a wave schedule from a JSON file (relative paths are looked up in the game's folder)
+# Format: {"loop": bool, "waves": [wave, ...]} where each wave may set
+#   duration (seconds, null = forever), interval (seconds between spawn ticks, null = ASTEROID_SPAWN_RATE),
+#   burst (asteroids per tick), kinds (allowed sizes, null = 1..ASTEROID_KINDS), speed ([low, high] in whole pixels/s),
+#   spread (largest random turn in whole degrees) and edges (indices into AsteroidField.edges)
+def load_waves(path):
+    path = os.path.join(os.path.dirname(os.path.abspath(__file__)), path)
+    with open(path) as waves_file:
+        return validate_waves(json.load(waves_file), path)
 
-            # Call the spawn method to create the asteroid with a size and velocity
-            self.spawn(ASTEROID_MIN_RADIUS * kind, position, velocity)
+# Check a wave schedule and return it; source names it in error messages
+def validate_waves(schedule, source):
+    if not schedule.get("waves"):
+        raise ValueError(f"{source} defines no waves")
+    # A zero duration or interval would stall the spawner in an endless loop, and a burst below 1 spawns nothing
+    for index, wave in enumerate(schedule["waves"]):
+        for key in ("duration", "interval"):
+            value = wave.get(key)
+            if value is not None and not value > 0:
+                raise ValueError(f"{source}: wave {index} {key} must be null or greater than 0, got {value!r}")
+        burst = wave.get("burst", 1)
+        if not (type(burst) is int and burst >= 1):
+            raise ValueError(f"{source}: wave {index} burst must be a whole number >= 1, got {burst!r}")
+        # Speeds and turns are drawn as whole numbers, so they must be integers
+        speed = wave.get("speed", [40, 100])
+        if not (isinstance(speed, (list, tuple)) and len(speed) == 2 and all(type(value) is int for value in speed) and 0 <= speed[0] <= speed[1]):
+            raise ValueError(f"{source}: wave {index} speed must be [low, high] with whole numbers 0 <= low <= high, got {speed!r}")
+        spread = wave.get("spread", 30)
+        if not (type(spread) is int and spread >= 0):
+            raise ValueError(f"{source}: wave {index} spread must be a whole number of degrees >= 0, got {spread!r}")
+        edges = wave.get("edges", [0, 1, 2, 3])
+        if not (edges and all(type(edge) is int and 0 <= edge < len(AsteroidField.edges) for edge in edges)):
+            raise ValueError(f"{source}: wave {index} edges must list indices 0..{len(AsteroidField.edges) - 1}, got {edges!r}")
+        kinds = wave.get("kinds")
+        if kinds is not None and not all(type(kind) is int and kind >= 1 for kind in kinds):
+            raise ValueError(f"{source}: wave {index} kinds must be whole numbers >= 1, got {kinds!r}")
+    return schedule
@@ -0,0 +1,117 @@
+import os  # Import os to skip music tracks that are not installed
+import itertools  # Import itertools for a running counter that orders voices by age
+import pygame  # Import pygame for the mixer
+from constants import *  # Import constants (AUDIO_CHANNELS sets the size of the channel pool)
+from assets import registry  # Import the shared asset registry for the sounds
+
+# Sound categories: name -> (most voices playing at once, priority)
+# When the pool is full, a sound may take over a channel playing a lower priority category
+SOUND_CATEGORIES = {
+    "death": (1, 3),
+    "player": (2, 2),
+    "explosion": (4, 1),
+}
+
+# Event posted by pygame.mixer.music when a track ends
+MUSIC_END_EVENT = pygame.USEREVENT
+
+# AudioManager queues sound requests from gameplay code and plays them once per frame without blocking
+# Music is streamed from disk by pygame.mixer.music, so every mixer channel is in the sound effect pool
+class AudioManager:
+
+    # Constructor to create a manager that stays silent until start() is called
+    def __init__(self):
+        self.enabled = False  # Whether the mixer is running (play() is a no-op otherwise)
+        self.queue = []  # (sound name, category) requests waiting for the next dispatch()
+        self.music = []  # Paths of the background music tracks in rotation
+        self.music_index = 0  # Track to play next
+        self.channels = []  # Pool of channels for sound effects
+        self.voices = {}  # Channel index -> (category, order started) for the sound last started on it
+        self.order = itertools.count()  # Increases every time a voice starts
+
+    # Set up the channel pool (does nothing if the mixer is not initialized, e.g. when running headless)
+    def start(self, channel_count=AUDIO_CHANNELS):
+        if pygame.mixer.get_init() is None:
+            return
+        pygame.mixer.set_num_channels(channel_count)
+        self.channels = [pygame.mixer.Channel(index) for index in range(channel_count)]
+        self.enabled = True
+
+    # Ask for a sound to be played at the next dispatch()
+    def play(self, name, category):
+        if self.enabled:
+            self.queue.append((name, category))
+
+    # Play this frame's queued sounds: each sound at most once, highest priority first
+    def dispatch(self):
+        if not self.queue:
+            return
+        requests = sorted(self.queue, key=lambda request: SOUND_CATEGORIES[request[1]][1], reverse=True)
+        self.queue.clear()
+        played = set()  # Names already started this frame
+        for name, category in requests:
+            if name in played:  # Identical sounds in the same frame would just stack on top of each other
+                continue
+            played.add(name)
+            self.start_voice(name, category)
+
+    # Pick a channel for a sound within its category's limit and priority, then start it
+    def start_voice(self, name, category):
+        sound = registry.sound(name)
+        if sound is None:
+            return
+        limit, priority = SOUND_CATEGORIES[category]
+        busy = [index for index, channel in enumerate(self.channels) if channel.get_busy()]
+
+        # The category is at its voice limit: replace its oldest voice
+        same = [index for index in busy if self.voices[index][0] == category]
+        if len(same) >= limit:
+            index = min(same, key=lambda index: self.voices[index][1])
+        else:
+            idle = [index for index in range(len(self.channels)) if index not in busy]
+            if idle:
+                index = idle[0]
+            else:
+                # Every channel is busy: take over the oldest voice of a lower priority category, or give up
+                lower = [index for index in busy if SOUND_CATEGORIES[self.voices[index][0]][1] < priority]
+                if not lower:
+                    return
+                index = min(lower, key=lambda index: self.voices[index][1])
+
+        self.channels[index].play(sound)
+        self.voices[index] = (category, next(self.order))
+
+    # Whether any sound of the given category is still playing
+    def is_playing(self, category):
+        return any(
+            channel.get_busy() and self.voices.get(index, (None,))[0] == category
+            for index, channel in enumerate(self.channels)
+        )
+
+    # Start rotating through the background music tracks (file paths; missing files are skipped)
+    # Only the playing track is open, and it is decoded a little at a time as it plays
+    def play_music(self, tracks):
+        if not self.enabled:
+            return
+        self.music = [track for track in tracks if os.path.exists(track)]
+        self.music_index = 0
+        pygame.mixer.music.set_endevent(MUSIC_END_EVENT)  # Post an event when a track ends
+        self.play_next_track()
+
+    # Stream the next track in the rotation
+    def play_next_track(self):
+        if not self.music:
+            return
+        pygame.mixer.music.load(self.music[self.music_index])
+        pygame.mixer.music.play()
+        self.music_index = (self.music_index + 1) % len(self.music)  # Cycle through the music list
+
+    # Handle a pygame event; returns True if it was the music end event
+    def handle_event(self, event):
+        if event.type == MUSIC_END_EVENT:
+            self.play_next_track()
+            return True
+        return False
+
+# The shared audio manager used by every game object
+audio_manager = AudioManager()
@@ -0,0 +1,115 @@
+import os  # Import os to select SDL's dummy drivers and count CPUs
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")  # Simulations never open a window
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")  # ...or play sound
+
+import argparse  # Import argparse for the command line options
+import itertools  # Import itertools to expand the sweep grid
+import json  # Import json for the sweep file and the results stream
+import multiprocessing  # Import multiprocessing for the worker pool
+import random  # Import random to seed each run
+import time  # Import time to measure per-frame cost
+from constants import *  # Import constants (SIMULATION_DT is the default step size)
+from world import World  # Import the game simulation
+from bots import BOTS  # Import the scripted players
+from replay import load_replay  # Import the replay reader for scripted input
+from profiler import percentile  # Import the percentile helper for per-frame cost
+from tunables import apply_overrides  # Import the constants override helper
+
+# Defaults for anything a sweep file leaves out
+DEFAULT_FRAMES = 60 * 60 * 5  # Five minutes of game time
+DEFAULT_BOT = "hunter"
+
+# Expand a sweep description into a list of runs
+# The sweep is a dict with optional keys:
+#   frames, dt, bot, inputs (replay file whose inputs are used instead of a bot), seeds (list),
+#   base (overrides applied to every run), grid (name -> list of values, every combination is run),
+#   configs (list of explicit override dicts, run in addition to the grid)
+def expand_sweep(sweep):
+    base = sweep.get("base", {})
+    grid = sweep.get("grid", {})
+    names = sorted(grid)
+    configs = [dict(zip(names, values)) for values in itertools.product(*(grid[name] for name in names))]
+    configs += sweep.get("configs", [])
+
+    runs = []
+    for config in configs:
+        for seed in sweep.get("seeds", [0]):
+            runs.append({
+                "id": len(runs),
+                "seed": seed,
+                "frames": sweep.get("frames", DEFAULT_FRAMES),
+                "dt": sweep.get("dt", SIMULATION_DT),
+                "bot": sweep.get("bot", DEFAULT_BOT),
+                "inputs": sweep.get("inputs"),
+                "overrides": {**base, **config},
+            })
+    return runs
+
+# Run one seeded headless game with its own constants and return its metrics (runs in a worker process)
+def run_simulation(run):
+    # Each worker runs one simulation at a time, so the overrides can simply be applied for the whole run
+    apply_overrides(run["overrides"])
+    random.seed(run["seed"])
+    world = World()
+
+    if run["inputs"]:  # Scripted input: replay the recorded controls, looping if the run is longer
+        scripted = [inputs for inputs, dt, expected in load_replay(run["inputs"])[2]]
+        controls = lambda frame, world: scripted[frame % len(scripted)]
+    else:
+        controls = BOTS[run["bot"]](run["seed"])
+
+    dt = run["dt"]
+    step_times = []  # Milliseconds per step
+    peak_entities = 0
+    start = time.perf_counter()
+    for frame in range(run["frames"]):
+        inputs = controls(frame, world)
+        step_start = time.perf_counter()
+        world.step(inputs, dt)
+        step_times.append((time.perf_counter() - step_start) * 1000)
+        peak_entities = max(peak_entities, len(world.asteroids) + len(world.shots))
+        if world.game_over:
+            break
+
+    return {
+        "id": run["id"],
+        "seed": run["seed"],
+        "bot": None if run["inputs"] else run["bot"],
+        "inputs": run["inputs"],
+        "overrides": run["overrides"],
+        "frames": world.frame,
+        "survival_time": world.elapsed,
+        "game_over": world.game_over,
+        "score": world.score,
+        "peak_entities": peak_entities,
+        "step_ms_mean": sum(step_times) / len(step_times),
+        "step_ms_p95": percentile(step_times, 95),
+        "step_ms_max": max(step_times),
+        "wall_seconds": time.perf_counter() - start,
+    }
+
+# Command line entry point: run every configuration of a sweep across a process pool
+def main():
+    parser = argparse.ArgumentParser(description="Run many seeded headless simulations in parallel for parameter sweeps.")
+    parser.add_argument("sweep", help="sweep JSON file (see expand_sweep for the format)")
+    parser.add_argument("--output", default="results.jsonl", help="results file, one JSON object per run")
+    parser.add_argument("--workers", type=int, default=os.cpu_count(), help="number of worker processes")
+    args = parser.parse_args()
+
+    with open(args.sweep) as sweep_file:
+        runs = expand_sweep(json.load(sweep_file))
+    print(f"{len(runs)} runs on {args.workers} workers, writing {args.output}")
+
+    # maxtasksperchild=1 gives every run a fresh process, so no overrides or pools leak between runs
+    start = time.perf_counter()
+    with multiprocessing.Pool(args.workers, maxtasksperchild=1) as pool, open(args.output, "w") as output:
+        for done, result in enumerate(pool.imap_unordered(run_simulation, runs), 1):
+            output.write(json.dumps(result) + "\n")
+            output.flush()  # Stream results so a long sweep can be inspected while it runs
+            print(f"[{done}/{len(runs)}] run {result['id']}: survived {result['survival_time']:.1f} s, "
+                  f"score {result['score']}, {result['step_ms_mean']:.3f} ms/step")
+    print(f"Finished in {time.perf_counter() - start:.1f} s")
+
+# Run the batch if this script is executed directly
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,215 @@
+import os  # Import os to select SDL's dummy drivers before pygame starts
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")  # Benchmarks never open a window
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")  # ...or play sound
+
+import argparse  # Import argparse for the command line options
+import json  # Import json for the baseline file
+import multiprocessing  # Import multiprocessing to run each scenario in a fresh process
+import random  # Import random to seed each scenario
+import sys  # Import sys for the exit code
+import time  # Import time to measure throughput
+from concurrent.futures import ProcessPoolExecutor  # Import the process pool used to isolate scenarios
+import pygame  # Import pygame for the draw target
+from constants import *  # Import constants (screen size, radii)
+from inputstate import InputState  # Import the control snapshot fed to the world
+from world import World  # Import the game simulation
+from asteroid import Asteroid  # Import Asteroid to build scripted fields
+from shot import Shot  # Import Shot to build scripted volleys
+from assets import registry  # Import the asset registry so images are converted like in the game
+from profiler import FrameProfiler  # Import the per-phase timer
+from tunables import overridden  # Import the constants override helper
+
+# Default location of the stored baseline
+BASELINE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "benchmark_baseline.json")
+
+# How much slower (or, for throughput, lower) than the baseline a metric may be before it counts as a regression
+DEFAULT_TOLERANCE = 0.25
+
+# Per-frame times that grow by less than this many milliseconds are treated as noise
+MIN_REGRESSION_MS = 0.05
+
+# Move the player far off screen so nothing can hit it and the run lasts the full number of frames
+def park_player(world):
+    world.player.position.update(-10 * SCREEN_WIDTH, -10 * SCREEN_HEIGHT)
+
+# Place count asteroids of the given radius at random spots on the screen with random slow velocities
+def scatter_asteroids(count, radius):
+    for _ in range(count):
+        asteroid = Asteroid.create(random.uniform(0, SCREEN_WIDTH), random.uniform(0, SCREEN_HEIGHT), radius)
+        asteroid.velocity.update(random.uniform(-40, 40), random.uniform(-40, 40))
+
+# Scenario: sustained AsteroidField spawning, one asteroid every frame
+def spawn_setup(world):
+    park_player(world)
+
+def spawn_frame(world, frame):
+    return InputState()
+
+# Scenario: full-size asteroids are shot every frame so Asteroid.split() cascades down to ASTEROID_MIN_RADIUS
+def split_setup(world):
+    park_player(world)
+
+def split_frame(world, frame):
+    if not world.asteroids:  # Previous cascade finished, start a new one
+        scatter_asteroids(300, ASTEROID_MAX_RADIUS)
+    for asteroid in world.asteroids.sprites():  # One shot sitting on every asteroid
+        Shot.create(asteroid.position.x, asteroid.position.y, 0)
+    return InputState()
+
+# Scenario: the player spins and fires with no cooldown
+def flood_setup(world):
+    world.player.position.update(SCREEN_WIDTH / 2, SCREEN_HEIGHT / 2)
+
+def flood_frame(world, frame):
+    return InputState(right=True, fire=True)
+
+# Scenario: thousands of asteroids and shots crossing each other every frame
+def storm_setup(world):
+    park_player(world)
+    scatter_asteroids(2000, ASTEROID_MIN_RADIUS)
+
+def storm_frame(world, frame):
+    missing = 2000 - len(world.shots)
+    for _ in range(missing):  # Top the shots back up after every hit
+        Shot.create(random.uniform(0, SCREEN_WIDTH), random.uniform(0, SCREEN_HEIGHT), random.uniform(0, 360))
+    missing = 2000 - len(world.asteroids)
+    if missing > 0:
+        scatter_asteroids(missing, ASTEROID_MIN_RADIUS)
+    return InputState()
+
+# Every scenario: number of frames, constant overrides, setup(world) and frame(world, frame) -> InputState
+SCENARIOS = {
+    "spawn": {
+        "frames": 3000,
+        "overrides": {"ASTEROID_SPAWN_RATE": SIMULATION_DT, "MAX_ASTEROIDS": 100000},
+        "setup": spawn_setup,
+        "frame": spawn_frame,
+    },
+    "split_cascade": {
+        "frames": 600,
+        "overrides": {"ASTEROID_SPAWN_RATE": 1e9, "MAX_ASTEROIDS": 100000, "MAX_SHOTS": 100000},
+        "setup": split_setup,
+        "frame": split_frame,
+    },
+    "shot_flood": {
+        "frames": 3000,
+        "overrides": {"ASTEROID_SPAWN_RATE": 1e9, "PLAYER_SHOOT_COOLDOWN": 0, "MAX_SHOTS": 100000},
+        "setup": flood_setup,
+        "frame": flood_frame,
+    },
+    "collision_storm": {
+        "frames": 300,
+        "overrides": {"ASTEROID_SPAWN_RATE": 1e9, "MAX_ASTEROIDS": 100000, "MAX_SHOTS": 100000},
+        "setup": storm_setup,
+        "frame": storm_frame,
+    },
+}
+
+# Run one scenario headless and return its metrics (runs inside a fresh worker process)
+def run_scenario(name):
+    scenario = SCENARIOS[name]
+    pygame.display.init()
+    screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+    registry.preload()
+
+    with overridden(scenario["overrides"]):
+        random.seed(name)  # Every build runs exactly the same workload
+        world = World()
+        profiler = FrameProfiler(window=scenario["frames"])
+        world.profiler = profiler
+        scenario["setup"](world)
+
+        entity_frames = 0  # Sum over frames of live asteroids and shots
+        busy = 0.0  # Seconds spent stepping and drawing
+        for frame in range(scenario["frames"]):
+            inputs = scenario["frame"](world, frame)
+            start = time.perf_counter()
+            world.step(inputs, SIMULATION_DT)
+            with profiler.phase("draw"):
+                world.draw(screen)
+            busy += time.perf_counter() - start
+            entity_frames += len(world.asteroids) + len(world.shots)
+            profiler.end_frame(world.entity_counts())
+
+    frames = len(profiler.trace)
+    metrics = {"frames": frames}
+    for phase in ("update", "collision", "draw"):
+        metrics[f"{phase}_ms"] = sum(frame.get(phase, 0.0) for frame in profiler.trace) / frames
+    metrics["step_and_draw_ms"] = busy * 1000 / frames
+    metrics["entities_per_second"] = entity_frames / busy
+
+    # Peak resident set size (kilobytes on Linux); the resource module is Unix-only, so it is None on Windows
+    try:
+        import resource
+    except ImportError:
+        metrics["peak_rss_kb"] = None
+    else:
+        metrics["peak_rss_kb"] = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return metrics
+
+# Compare metrics with the baseline; returns a list of human readable regression messages
+def find_regressions(results, baseline, tolerance):
+    regressions = []
+    for name, metrics in results.items():
+        for metric, value in metrics.items():
+            expected = baseline.get(name, {}).get(metric)
+            if expected is None or value is None or metric == "frames":  # Not measured on one side
+                continue
+            if metric == "entities_per_second":  # Higher is better
+                if value < expected * (1 - tolerance):
+                    regressions.append(f"{name}.{metric}: {value:.0f} < baseline {expected:.0f}")
+            elif metric.endswith("_ms") and value - expected < MIN_REGRESSION_MS:  # Too small to measure reliably
+                continue
+            elif value > expected * (1 + tolerance):  # Lower is better
+                regressions.append(f"{name}.{metric}: {value:.3f} > baseline {expected:.3f}")
+    return regressions
+
+# Command line entry point: run the scenarios, print a table and compare against the baseline
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark spawn, split, collision and draw throughput headless.")
+    parser.add_argument("scenarios", nargs="*", default=list(SCENARIOS), help="scenarios to run (default: all)")
+    parser.add_argument("--baseline", default=BASELINE_PATH, help="baseline JSON file")
+    parser.add_argument("--update-baseline", action="store_true", help="store these results as the new baseline")
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE, help="allowed slowdown as a fraction")
+    args = parser.parse_args()
+
+    # A fresh process per scenario keeps peak RSS and caches from leaking between scenarios
+    results = {}
+    context = multiprocessing.get_context("spawn")
+    for name in args.scenarios:
+        with ProcessPoolExecutor(max_workers=1, mp_context=context) as executor:
+            results[name] = executor.submit(run_scenario, name).result()
+        metrics = results[name]
+        print(
+            f"{name:<16} update {metrics['update_ms']:7.3f} ms  collision {metrics['collision_ms']:7.3f} ms  "
+            f"draw {metrics['draw_ms']:7.3f} ms  {metrics['entities_per_second']:10.0f} entities/s  "
+            + (f"peak RSS {metrics['peak_rss_kb'] / 1024:6.1f} MiB" if metrics["peak_rss_kb"] is not None else "")
+        )
+
+    if args.update_baseline:
+        baseline = {}
+        if os.path.exists(args.baseline):
+            with open(args.baseline) as baseline_file:
+                baseline = json.load(baseline_file)
+        baseline.update(results)
+        with open(args.baseline, "w") as baseline_file:
+            json.dump(baseline, baseline_file, indent=2, sort_keys=True)
+        print(f"Baseline written to {args.baseline}")
+        return
+
+    if not os.path.exists(args.baseline):
+        print(f"No baseline at {args.baseline}; run with --update-baseline to create one")
+        return
+    with open(args.baseline) as baseline_file:
+        baseline = json.load(baseline_file)
+    regressions = find_regressions(results, baseline, args.tolerance)
+    if regressions:
+        print("REGRESSIONS:")
+        for regression in regressions:
+            print(f"  {regression}")
+        sys.exit(1)
+    print("No regressions against the baseline")
+
+# Run the benchmarks if this script is executed directly
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+import random  # Import random for the random bot's own generator
+import pygame  # Import pygame for vector maths
+from inputstate import InputState  # Import the control snapshot the bots produce
+
+# Every bot is a function (frame, world) -> InputState, the same shape run_headless() accepts
+# Bots never touch the global random stream, so they don't change what the seeded game does
+
+# Bot that never touches the controls
+def idle_bot(seed):
+    def controls(frame, world):
+        return InputState()
+    return controls
+
+# Bot that spins on the spot and fires constantly
+def spinner_bot(seed):
+    def controls(frame, world):
+        return InputState(right=True, fire=True)
+    return controls
+
+# Bot that mashes random controls, changing them every few frames
+def random_bot(seed):
+    rng = random.Random(seed)  # Own generator, seeded per run
+    state = {"inputs": InputState(), "until": 0}
+    def controls(frame, world):
+        if frame >= state["until"]:
+            state["inputs"] = InputState(
+                left=rng.random() < 0.3,
+                right=rng.random() < 0.3,
+                forward=rng.random() < 0.2,
+                backward=rng.random() < 0.1,
+                fire=rng.random() < 0.7,
+            )
+            state["until"] = frame + rng.randint(5, 30)
+        return state["inputs"]
+    return controls
+
+# Position of the asteroid closest to position as a Vector2, or None if there are none
+# Works with World (asteroids are sprites) and ArrayWorld (asteroids live in an EntityStore)
+def nearest_asteroid(world, position):
+    asteroids = world.asteroids
+    if hasattr(asteroids, "live"):  # EntityStore: one vectorized distance pass over the live slots
+        positions = asteroids.positions[asteroids.live()]
+        if len(positions) == 0:
+            return None
+        offsets = positions - (position.x, position.y)
+        return pygame.Vector2(*positions[(offsets * offsets).sum(axis=1).argmin()])
+
+    nearest = None
+    nearest_distance = None
+    for asteroid in asteroids:
+        distance = position.distance_squared_to(asteroid.position)
+        if nearest is None or distance < nearest_distance:
+            nearest = asteroid
+            nearest_distance = distance
+    return None if nearest is None else nearest.position
+
+# Bot that turns towards the nearest asteroid and fires once it is lined up
+def hunter_bot(seed):
+    def controls(frame, world):
+        player = world.player
+        target = nearest_asteroid(world, player.position)
+        if target is None:
+            return InputState()
+
+        # Shots fly along (0, -1) rotated by the player's rotation
+        wanted = pygame.Vector2(0, -1).angle_to(target - player.position)
+        difference = (wanted - player.rotation + 180) % 360 - 180  # Shortest turn, in -180..180 degrees
+        return InputState(left=difference < -3, right=difference > 3, fire=abs(difference) < 10)
+    return controls
+
+# Bots by name, for command line and sweep files
+BOTS = {
+    "idle": idle_bot,
+    "spinner": spinner_bot,
+    "random": random_bot,
+    "hunter": hunter_bot,
+}
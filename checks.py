@@ -0,0 +1,60 @@
+import os  # Import os to select SDL's dummy drivers before pygame starts
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")  # Checks never open a window
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")  # ...or play sound
+
+import random  # Import random to seed each check
+import sys  # Import sys for the exit code
+from inputstate import InputState  # Import the control snapshot fed to the worlds
+from world import World  # Import the sprite engine
+from asteroid import Asteroid  # Import Asteroid to place scripted asteroids
+from shot import Shot  # Import Shot to fire scripted shots
+
+# Build a world with no spawning and the player parked far away, so only the scripted objects interact
+def quiet_world(world_class):
+    random.seed(0)
+    world = world_class()
+    world.player.position.update(-100000, -100000)
+    world.asteroid_field.spawn_timer = -1e9
+    return world
+
+# Two fast shots side by side sweep through two asteroids in one 200 px step
+# Both shots first reach the same asteroid; the one that loses it must still hit the asteroid behind
+def check_fast_shots_share_a_path(world_class):
+    world = quiet_world(world_class)
+    asteroids = [(400, 300), (470, 300)]
+    shots = [(360, 300), (360, 305)]
+    if world_class is World:
+        for x, y in asteroids:
+            Asteroid.create(x, y, 20)
+        for x, y in shots:
+            Shot.create(x, y, 90)  # Rotation 90 fires along +x
+    else:
+        import numpy as np
+        world.asteroids.add_batch(np.array(asteroids, dtype=float), np.zeros((2, 2)), np.full(2, 20.0))
+        world.shots.add_batch(np.array(shots, dtype=float), np.array([[500.0, 0.0]] * 2), np.full(2, 5.0))
+    world.step(InputState(), 0.4)
+    return world.score == 2, f"score {world.score}, expected 2"
+
+# Every check, run against each engine
+CHECKS = [check_fast_shots_share_a_path]
+
+# Command line entry point: run every check on both engines and exit non-zero if any fails
+def main():
+    engines = [World]
+    try:
+        from arrayworld import ArrayWorld
+        engines.append(ArrayWorld)
+    except ImportError:  # NumPy is optional, check the sprite engine only
+        pass
+
+    failed = 0
+    for check in CHECKS:
+        for engine in engines:
+            passed, detail = check(engine)
+            print(f"{'ok  ' if passed else 'FAIL'} {check.__name__} [{engine.__name__}]: {detail}")
+            failed += not passed
+    sys.exit(1 if failed else 0)
+
+# Run the checks if this script is executed directly
+if __name__ == "__main__":
+    main()
@@ -2,7 +2,8 @@ import pygame  # Import Pygame module
 
 # Base class for game objects that are circular shapes (e.g., player, shots, asteroids)
 class CircleShape(pygame.sprite.Sprite):
-    
+    pool = None  # ObjectPool used by create() (subclasses set their own, like containers)
+
     # Constructor to initialize the CircleShape object
     def __init__(self, x, y, radius):
         # Initialize the parent class (Sprite) with containers, if available
@@ -12,13 +13,43 @@ class CircleShape(pygame.sprite.Sprite):
             super().__init__()  # Otherwise, just initialize the Sprite class without containers
         
         self.position = pygame.Vector2(x, y)  # Set the initial position as a pygame Vector2 (x, y)
+        self.previous_position = pygame.Vector2(x, y)  # Position before the last simulation step (for interpolated drawing)
         self.velocity = pygame.Vector2(0, 0)  # Initialize velocity as a zero vector (no movement by default)
         self.radius = radius  # Set the radius of the object (used for collision detection)
+        self.age = 0.0  # Seconds this object has been alive (used to despawn old objects)
+
+    # Create an object of this class, recycling a killed one from the class's pool if it has one
+    @classmethod
+    def create(cls, *args):
+        if cls.pool is not None:
+            return cls.pool.acquire(*args)
+        return cls(*args)
+
+    # Reinitialize a recycled object in place (reuses the existing Vector2s instead of allocating new ones)
+    def reset(self, x, y, radius):
+        self.position.update(x, y)
+        self.previous_position.update(x, y)
+        self.velocity.update(0, 0)
+        self.radius = radius
+        self.age = 0.0
+
+    # Remove the object from all its groups and, if it is pooled, hand it back to the pool for reuse
+    def kill(self):
+        was_alive = self.alive()  # Only release once, even if kill() is called twice
+        super().kill()
+        if was_alive and self.pool is not None:
+            self.pool.release(self)
+
+    # Where to draw the object: alpha of the way from its position before the last step to its current one
+    def render_position(self, alpha):
+        if alpha >= 1.0:
+            return self.position
+        return self.previous_position.lerp(self.position, alpha)
 
-    
     # This method is a placeholder for drawing the object on the screen
     # Sub-classes must override this method to specify how they will be drawn
-    def draw(self, screen):
+    # alpha is how far the frame is between the last two simulation steps (1.0 draws the current position)
+    def draw(self, screen, alpha=1.0):
         pass  # Nothing happens here. Subclasses should implement this.
 
     # This method is a placeholder for updating the object's state
@@ -28,6 +59,7 @@ class CircleShape(pygame.sprite.Sprite):
 
     # Collision detection method: Checks if this object collides with another CircleShape
     def collision(self, other):
-        # Calculate the distance between the two objects' positions
-        # If the distance is less than or equal to the sum of their radii, they are colliding
-        return (self.position.distance_to(other.position) <= self.radius + other.radius)
+        # Compare the squared distance between the two objects' positions against the squared sum of their radii
+        # If it is less than or equal, they are colliding (this avoids a square root per test)
+        reach = self.radius + other.radius
+        return (self.position.distance_squared_to(other.position) <= reach * reach)
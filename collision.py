@@ -0,0 +1,136 @@
+import math  # Import math for the square root in the swept test
+from constants import *  # Import constants (ASTEROID_MAX_RADIUS is used to size the grid cells)
+
+# Narrow phase: checks whether two circular objects overlap
+# Compares squared distances so no square root is needed per test
+def circles_overlap(a, b):
+    reach = a.radius + b.radius  # Distance at which the two circles start touching
+    return a.position.distance_squared_to(b.position) <= reach * reach
+
+# Swept narrow phase: when did two circles first touch during the last step?
+# Both objects moved in a straight line from previous_position to position, so only their relative motion matters
+# Returns the time of impact as a fraction of the step (0.0 = already touching at the start), or None if they never touched
+def time_of_impact(a, b):
+    start = b.previous_position - a.previous_position  # Offset between the two at the start of the step
+    motion = (b.position - b.previous_position) - (a.position - a.previous_position)  # Relative motion over the step
+    reach = a.radius + b.radius
+    gap = start.dot(start) - reach * reach
+    if gap <= 0:  # Already touching before the step
+        return 0.0
+    closing = start.dot(motion)
+    if closing >= 0:  # Not moving towards each other
+        return None
+    speed = motion.dot(motion)
+    discriminant = closing * closing - speed * gap
+    if discriminant < 0:  # The paths pass without touching
+        return None
+    time = (-closing - math.sqrt(discriminant)) / speed  # First root of |start + motion * t| = reach
+    return time if time <= 1.0 else None
+
+# Broad phase: a uniform grid that buckets objects by the cells their bounding box covers
+class SpatialHash:
+
+    # Constructor to initialize an empty grid
+    # A cell as wide as the largest asteroid means every asteroid touches at most four cells
+    def __init__(self, cell_size=None):
+        if cell_size is None:  # Read at call time so overridden constants take effect
+            cell_size = ASTEROID_MAX_RADIUS * 2
+        self.cell_size = cell_size  # Width and height of a single grid cell in pixels
+        self.cells = {}  # Maps (column, row) to the list of objects inside that cell
+
+    # Remove every object from the grid (called once per frame before re-inserting)
+    def clear(self):
+        self.cells.clear()
+
+    # Work out the range of cells covered by a circle at the given position
+    def cell_range(self, position, radius):
+        size = self.cell_size
+        min_x = int((position.x - radius) // size)
+        max_x = int((position.x + radius) // size)
+        min_y = int((position.y - radius) // size)
+        max_y = int((position.y + radius) // size)
+        return min_x, max_x, min_y, max_y
+
+    # Empty the grid and bucket every object in it (called once per step)
+    def rebuild(self, objects):
+        self.cells.clear()
+        for obj in objects:
+            self.insert(obj)
+
+    # Add an object to every cell its bounding box overlaps
+    def insert(self, obj):
+        min_x, max_x, min_y, max_y = self.cell_range(obj.position, obj.radius)
+        for cx in range(min_x, max_x + 1):
+            for cy in range(min_y, max_y + 1):
+                self.cells.setdefault((cx, cy), []).append(obj)
+
+    # Return the objects sharing at least one cell with a circle (each object is listed once)
+    def query(self, position, radius):
+        min_x, max_x, min_y, max_y = self.cell_range(position, radius)
+        if min_x == max_x and min_y == max_y:  # Fast path: the circle sits inside a single cell
+            return self.cells.get((min_x, min_y), ())
+
+        found = []  # Candidates in the order they were first seen
+        seen = set()  # Ids of objects already added to found
+        for cx in range(min_x, max_x + 1):
+            for cy in range(min_y, max_y + 1):
+                for obj in self.cells.get((cx, cy), ()):
+                    if id(obj) not in seen:
+                        seen.add(id(obj))
+                        found.append(obj)
+        return found
+
+# Find the first asteroid touching the player, or None if the player is safe
+# grid is a SpatialHash already holding the asteroids; without one every asteroid is checked
+# (building a grid just for the player's single query would cost more than the scan)
+def find_player_hit(player, asteroids, grid=None):
+    candidates = asteroids if grid is None else grid.query(player.position, player.radius)
+    for asteroid in candidates:
+        if circles_overlap(asteroid, player):
+            return asteroid
+    return None
+
+# Find every (asteroid, shot) pair that collides this frame
+# Each asteroid and each shot appears in at most one pair, so an asteroid that has
+# already been split (or a shot that has already been spent) is never hit again
+# Shots that moved further than SWEPT_COLLISION_DISTANCE this step could have jumped over an asteroid,
+# so they are swept along their path instead and hit the first asteroid they reached
+# grid is a SpatialHash already holding the asteroids (one is built here if it is None)
+def find_shot_hits(asteroids, shots, grid=None):
+    if not shots:  # Nothing to query, so don't bucket the asteroids at all
+        return []
+    if grid is None:  # Bucket the asteroids; shots are only ever tested against their neighbours
+        grid = SpatialHash()
+        grid.rebuild(asteroids)
+
+    hits = []  # Resolved (asteroid, shot) pairs
+    resolved = set()  # Ids of asteroids that have already been hit this frame
+    swept_distance = SWEPT_COLLISION_DISTANCE * SWEPT_COLLISION_DISTANCE
+    asteroid_motion = None  # Furthest any asteroid moved this step, only worked out if a shot needs sweeping
+    for shot in shots:
+        moved = shot.position - shot.previous_position
+        if moved.length_squared() > swept_distance:
+            if asteroid_motion is None:
+                asteroid_motion = max((asteroid.position.distance_to(asteroid.previous_position) for asteroid in asteroids), default=0.0)
+            # Candidates: every asteroid near the shot's path (padded by how far an asteroid could have moved)
+            first = None  # Earliest (time, asteroid) hit along the path
+            middle = shot.previous_position + moved * 0.5
+            for asteroid in grid.query(middle, moved.length() * 0.5 + shot.radius + asteroid_motion):
+                if id(asteroid) in resolved:
+                    continue
+                time = time_of_impact(asteroid, shot)
+                if time is not None and (first is None or time < first[0]):
+                    first = (time, asteroid)
+            if first is not None:
+                resolved.add(id(first[1]))
+                hits.append((first[1], shot))
+            continue
+
+        for asteroid in grid.query(shot.position, shot.radius):
+            if id(asteroid) in resolved:  # This asteroid was already destroyed by another shot
+                continue
+            if circles_overlap(asteroid, shot):
+                resolved.add(id(asteroid))
+                hits.append((asteroid, shot))
+                break  # The shot is spent, move on to the next one
+    return hits
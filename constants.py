@@ -13,3 +13,35 @@ PLAYER_SHOOT_SPEED = 500
 PLAYER_SHOOT_COOLDOWN = 0.3
 
 SHOT_RADIUS = 5
+
+ROTATION_STEPS = 360 # pre-rendered angles per sprite image
+
+SIMULATION_DT = 1 / 60 # seconds per fixed simulation step
+
+DESPAWN_MARGIN = ASTEROID_MAX_RADIUS * 2 # pixels past the screen edge before an entity is removed
+SHOT_MAX_LIFETIME = 3.0 # seconds
+ASTEROID_MAX_LIFETIME = 60.0 # seconds
+MAX_SHOTS = 256
+MAX_ASTEROIDS = 512
+
+SHOT_POOL_SIZE = MAX_SHOTS # killed shots kept for reuse
+SHOT_POOL_PREWARM = 32 # shots built at startup
+ASTEROID_POOL_SIZE = MAX_ASTEROIDS # killed asteroids kept for reuse
+ASTEROID_POOL_PREWARM = 64 # asteroids built at startup
+
+PROFILER_WINDOW = 300 # frames in the rolling percentile window
+
+REPLAY_HASH_INTERVAL = 60 # frames between state hashes in a replay file
+
+AUDIO_CHANNELS = 8 # mixer channels for sound effects (music streams through pygame.mixer.music)
+
+WAVES_FILE = "waves.json" # asteroid wave and burst definitions
+SPAWN_BATCH_SIZE = 32 # spawn parameters generated ahead of time
+SPAWN_CATCHUP_LIMIT = 8 # most spawn ticks caught up in one update after a long frame
+
+MAX_FRAME_TIME = 0.25 # longest frame the game loop tries to catch up on, in seconds
+MAX_CATCHUP_STEPS = 5 # most simulation steps run before a frame is drawn
+
+SWEPT_COLLISION_DISTANCE = SHOT_RADIUS * 2 # shots that moved further than this in one step are tested along their whole path
+
+ASSET_CACHE_FILE = "asset_cache.bin" # preprocessed screen-ready backdrop and UI images
@@ -0,0 +1,308 @@
+from constants import *  # Import constants (asteroid radii are used for splitting and grid size)
+
+# NumPy is optional: the sprite-based World works without it, only the array engine needs it
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# EntityStore keeps circular entities in preallocated structure-of-arrays NumPy buffers
+# Dead slots go onto a free list and are reused by later appends, so nothing is allocated per entity
+class EntityStore:
+
+    # Constructor to preallocate room for the given number of entities
+    def __init__(self, capacity=1024):
+        if np is None:
+            raise ImportError("EntityStore requires numpy (pip install numpy)")
+        self.capacity = 0  # Number of slots currently allocated
+        self.positions = np.zeros((0, 2))  # x, y of every slot
+        self.previous_positions = np.zeros((0, 2))  # x, y of every slot before the last integrate (for interpolated drawing)
+        self.velocities = np.zeros((0, 2))  # Velocity x, y of every slot
+        self.radii = np.zeros(0)  # Radius of every slot
+        self.ages = np.zeros(0)  # Seconds every slot's entity has been alive
+        self.alive = np.zeros(0, dtype=bool)  # True for slots holding a live entity
+        self.free = np.zeros(0, dtype=np.intp)  # Stack of free slot indices (top is free[free_count - 1])
+        self.free_count = 0  # Number of entries on the free stack
+        self.pending = []  # (x, y, vx, vy, radius) tuples waiting to be appended as one batch
+        self.grow(capacity)
+
+    # Number of live entities
+    def __len__(self):
+        return self.capacity - self.free_count
+
+    # Enlarge every buffer to new_capacity slots, pushing the new slots onto the free stack
+    def grow(self, new_capacity):
+        old_capacity = self.capacity
+        extra = new_capacity - old_capacity
+        self.positions = np.concatenate((self.positions, np.zeros((extra, 2))))
+        self.previous_positions = np.concatenate((self.previous_positions, np.zeros((extra, 2))))
+        self.velocities = np.concatenate((self.velocities, np.zeros((extra, 2))))
+        self.radii = np.concatenate((self.radii, np.zeros(extra)))
+        self.ages = np.concatenate((self.ages, np.zeros(extra)))
+        self.alive = np.concatenate((self.alive, np.zeros(extra, dtype=bool)))
+
+        # New slots go below the existing free entries, highest index first, so low slots are handed out first
+        free = np.empty(new_capacity, dtype=np.intp)
+        free[:extra] = np.arange(new_capacity - 1, old_capacity - 1, -1)
+        free[extra:extra + self.free_count] = self.free[:self.free_count]
+        self.free = free
+        self.free_count += extra
+        self.capacity = new_capacity
+
+    # Append a batch of entities; positions and velocities are (n, 2) arrays, radii is an (n,) array
+    # Returns the slot indices the new entities were stored in
+    def add_batch(self, positions, velocities, radii):
+        count = len(radii)
+        if count == 0:
+            return np.zeros(0, dtype=np.intp)
+        if count > self.free_count:  # Not enough free slots, double the buffers until there are
+            new_capacity = max(self.capacity * 2, 1)
+            while new_capacity - len(self) < count:
+                new_capacity *= 2
+            self.grow(new_capacity)
+
+        slots = self.free[self.free_count - count:self.free_count][::-1].copy()
+        self.free_count -= count
+        self.positions[slots] = positions
+        self.previous_positions[slots] = positions
+        self.velocities[slots] = velocities
+        self.radii[slots] = radii
+        self.ages[slots] = 0.0
+        self.alive[slots] = True
+        return slots
+
+    # Queue a single entity; queued entities are added together by the next flush()
+    def append(self, x, y, vx, vy, radius):
+        self.pending.append((x, y, vx, vy, radius))
+
+    # Add every queued entity in one batch
+    def flush(self):
+        if not self.pending:
+            return np.zeros(0, dtype=np.intp)
+        rows = np.array(self.pending, dtype=float)
+        self.pending.clear()
+        return self.add_batch(rows[:, 0:2], rows[:, 2:4], rows[:, 4])
+
+    # Remove the entities in the given slots and return the slots to the free list
+    def kill(self, slots):
+        slots = np.unique(slots)
+        slots = slots[self.alive[slots]]  # Ignore slots that are already dead
+        self.alive[slots] = False
+        self.free[self.free_count:self.free_count + len(slots)] = slots
+        self.free_count += len(slots)
+
+    # Indices of every live slot
+    def live(self):
+        return np.flatnonzero(self.alive)
+
+    # Positions of the given slots alpha of the way from before the last integrate to now
+    def render_positions(self, slots, alpha):
+        if alpha >= 1.0:
+            return self.positions[slots]
+        previous = self.previous_positions[slots]
+        return previous + (self.positions[slots] - previous) * alpha
+
+    # Move every live entity by its velocity (dead slots move too, which is harmless and avoids a mask)
+    def integrate(self, dt):
+        np.copyto(self.previous_positions, self.positions)
+        self.positions += self.velocities * dt
+        self.ages += dt
+
+    # Remove entities that drifted margin pixels past the screen or outlived max_lifetime,
+    # then, if more than cap are still alive, remove the oldest until it fits
+    # Returns the number of entities removed
+    def cull(self, max_lifetime, cap, margin=None):
+        if margin is None:  # Read at call time so overridden constants take effect
+            margin = DESPAWN_MARGIN
+        before = len(self)
+        slots = self.live()
+        x = self.positions[slots, 0]
+        y = self.positions[slots, 1]
+        expired = (
+            (self.ages[slots] > max_lifetime)
+            | (x < -margin) | (x > SCREEN_WIDTH + margin)
+            | (y < -margin) | (y > SCREEN_HEIGHT + margin)
+        )
+        self.kill(slots[expired])
+
+        excess = len(self) - cap
+        if excess > 0:
+            slots = self.live()
+            self.kill(slots[np.argsort(self.ages[slots], kind="stable")[-excess:]])
+        return before - len(self)
+
+# Find the slots of live entities in store that overlap the circle at (x, y) with the given radius
+def overlapping(store, x, y, radius):
+    slots = store.live()
+    offsets = store.positions[slots] - (x, y)
+    reach = store.radii[slots] + radius
+    return slots[np.einsum("ij,ij->i", offsets, offsets) <= reach * reach]
+
+# Vectorized swept test for pairs of moving circles (see collision.time_of_impact)
+# start and motion are (n, 2) arrays of relative offsets at the start of the step and relative motion over it
+# Returns each pair's time of impact as a fraction of the step, or NaN where the pair never touched
+def sweep_times(start, motion, reach):
+    gap = np.einsum("ij,ij->i", start, start) - reach * reach
+    closing = np.einsum("ij,ij->i", start, motion)
+    speed = np.einsum("ij,ij->i", motion, motion)
+    discriminant = closing * closing - speed * gap
+    with np.errstate(invalid="ignore", divide="ignore"):  # Pairs that miss are masked out below
+        times = (-closing - np.sqrt(discriminant)) / speed
+    touching = gap <= 0  # Already touching before the step
+    hit = touching | ((closing < 0) & (discriminant >= 0) & (times <= 1.0))
+    return np.where(hit, np.where(touching, 0.0, times), np.nan)
+
+# Vectorized broad and narrow phase between two stores (asteroids and shots)
+# Shots that moved further than SWEPT_COLLISION_DISTANCE this step are swept along their path
+# and hit the first asteroid they reached; the rest are tested where they are now
+# Returns two arrays (asteroid_slots, shot_slots) of hit pairs where each slot appears at most once
+def find_hits(asteroids, shots, cell_size=None):
+    if cell_size is None:  # Read at call time so overridden constants take effect
+        cell_size = ASTEROID_MAX_RADIUS * 2
+    empty = np.zeros(0, dtype=np.intp)
+    asteroid_slots = asteroids.live()
+    shot_slots = shots.live()
+    if len(asteroid_slots) == 0 or len(shot_slots) == 0:
+        return empty, empty
+
+    # Split off the fast shots
+    moved = shots.positions[shot_slots] - shots.previous_positions[shot_slots]
+    fast = np.einsum("ij,ij->i", moved, moved) > SWEPT_COLLISION_DISTANCE * SWEPT_COLLISION_DISTANCE
+    swept_slots = shot_slots[fast]
+    shot_slots = shot_slots[~fast]
+
+    # Broad phase: bucket asteroids by the grid cell of their centre and sort them by cell key
+    # A cell as wide as the largest asteroid means any hit lies in one of the 3x3 cells around the shot
+    stride = 1 << 20  # Keeps (column, row) pairs unique inside a single int64 key
+    asteroid_cells = np.floor(asteroids.positions[asteroid_slots] / cell_size).astype(np.int64)
+    asteroid_keys = asteroid_cells[:, 0] * stride + asteroid_cells[:, 1]
+    order = np.argsort(asteroid_keys, kind="stable")
+    sorted_keys = asteroid_keys[order]
+    sorted_slots = asteroid_slots[order]
+
+    # Sort the shots by cell too, so every searchsorted below walks its needles in order
+    shot_cells = np.floor(shots.positions[shot_slots] / cell_size).astype(np.int64)
+    order = np.argsort(shot_cells[:, 0] * stride + shot_cells[:, 1], kind="stable")
+    shot_slots = shot_slots[order]
+    shot_cells = shot_cells[order]
+    candidate_shots = []
+    candidate_asteroids = []
+    candidate_swept_shots = []
+    candidate_swept_asteroids = []
+    for dx in (-1, 0, 1):
+        for dy in (-1, 0, 1):
+            keys = (shot_cells[:, 0] + dx) * stride + (shot_cells[:, 1] + dy)
+            start = np.searchsorted(sorted_keys, keys, side="left")
+            end = np.searchsorted(sorted_keys, keys, side="right")
+            counts = end - start
+            total = int(counts.sum())
+            if total == 0:
+                continue
+            # Expand every [start, end) range into one row per candidate pair
+            firsts = np.repeat(start - np.cumsum(counts) + counts, counts)
+            candidate_shots.append(np.repeat(shot_slots, counts))
+            candidate_asteroids.append(sorted_slots[firsts + np.arange(total)])
+
+    # Fast shots: every grid column under the bounding box of the shot's path, padded by the largest asteroid
+    # and by how far an asteroid could have moved (keys within a column are contiguous, so one range per column)
+    if len(swept_slots):
+        asteroid_moved = asteroids.positions[asteroid_slots] - asteroids.previous_positions[asteroid_slots]
+        pad = asteroids.radii[asteroid_slots].max() + np.sqrt(np.einsum("ij,ij->i", asteroid_moved, asteroid_moved).max())
+        starts = shots.previous_positions[swept_slots]
+        ends = shots.positions[swept_slots]
+        lows = np.floor((np.minimum(starts, ends) - (shots.radii[swept_slots] + pad)[:, None]) / cell_size).astype(np.int64)
+        highs = np.floor((np.maximum(starts, ends) + (shots.radii[swept_slots] + pad)[:, None]) / cell_size).astype(np.int64)
+        for slot, (min_x, min_y), (max_x, max_y) in zip(swept_slots, lows, highs):
+            columns = np.arange(min_x, max_x + 1) * stride
+            column_starts = np.searchsorted(sorted_keys, columns + min_y, side="left")
+            column_ends = np.searchsorted(sorted_keys, columns + max_y, side="right")
+            for first, last in zip(column_starts, column_ends):
+                if first < last:
+                    candidate_swept_asteroids.append(sorted_slots[first:last])
+                    candidate_swept_shots.append(np.full(last - first, slot))
+    if not candidate_shots and not candidate_swept_shots:
+        return empty, empty
+
+    # Narrow phase: squared distance against squared sum of radii
+    pair_shots = np.concatenate(candidate_shots or [empty])
+    pair_asteroids = np.concatenate(candidate_asteroids or [empty])
+    offsets = shots.positions[pair_shots] - asteroids.positions[pair_asteroids]
+    reach = shots.radii[pair_shots] + asteroids.radii[pair_asteroids]
+    touching = np.einsum("ij,ij->i", offsets, offsets) <= reach * reach
+    pair_shots = pair_shots[touching]
+    pair_asteroids = pair_asteroids[touching]
+    pair_times = np.zeros(len(pair_shots))  # Time of impact within the step (0 for shots tested where they are)
+
+    # Swept narrow phase for the fast shots, using the relative motion of shot and asteroid over the step
+    if candidate_swept_shots:
+        swept_shots = np.concatenate(candidate_swept_shots)
+        swept_asteroids = np.concatenate(candidate_swept_asteroids)
+        start = shots.previous_positions[swept_shots] - asteroids.previous_positions[swept_asteroids]
+        motion = (
+            (shots.positions[swept_shots] - shots.previous_positions[swept_shots])
+            - (asteroids.positions[swept_asteroids] - asteroids.previous_positions[swept_asteroids])
+        )
+        times = sweep_times(start, motion, shots.radii[swept_shots] + asteroids.radii[swept_asteroids])
+        hit = ~np.isnan(times)
+        pair_shots = np.concatenate((pair_shots, swept_shots[hit]))
+        pair_asteroids = np.concatenate((pair_asteroids, swept_asteroids[hit]))
+        pair_times = np.concatenate((pair_times, times[hit]))
+
+    # Resolve in rounds: each shot picks its earliest impact, then each asteroid keeps its lowest shot slot
+    # A shot whose pick went to another shot tries again next round against the asteroids still free
+    # (like find_shot_hits skipping resolved asteroids), so it can't slip through a second asteroid on its path
+    hit_asteroids = []
+    hit_shots = []
+    while len(pair_shots):
+        order = np.lexsort((pair_asteroids, pair_times, pair_shots))
+        round_shots = pair_shots[order]
+        round_asteroids = pair_asteroids[order]
+        _, first = np.unique(round_shots, return_index=True)
+        round_shots = round_shots[first]
+        round_asteroids = round_asteroids[first]
+        _, first = np.unique(round_asteroids, return_index=True)
+        hit_shots.append(round_shots[first])
+        hit_asteroids.append(round_asteroids[first])
+
+        # Drop every pair involving a spent shot or a claimed asteroid
+        free = ~np.isin(pair_shots, hit_shots[-1]) & ~np.isin(pair_asteroids, hit_asteroids[-1])
+        pair_shots = pair_shots[free]
+        pair_asteroids = pair_asteroids[free]
+        pair_times = pair_times[free]
+    if not hit_shots:
+        return empty, empty
+    hit_asteroids = np.concatenate(hit_asteroids)
+    hit_shots = np.concatenate(hit_shots)
+    order = np.argsort(hit_asteroids)  # Same asteroid-slot order as a single round gives
+    return hit_asteroids[order], hit_shots[order]
+
+# Split the asteroids in the given slots the same way Asteroid.split() does, as one batched append
+# rng is a numpy Generator used for the spawn angles
+def split_batch(asteroids, slots, rng):
+    radii = asteroids.radii[slots]
+    velocities = asteroids.velocities[slots]
+    positions = asteroids.positions[slots]
+    asteroids.kill(slots)
+
+    # Asteroids that are already the smallest size just disappear
+    keep = radii > ASTEROID_MIN_RADIUS
+    if not keep.any():
+        return
+    radii = radii[keep] - ASTEROID_MIN_RADIUS
+    velocities = velocities[keep]
+    positions = positions[keep]
+
+    # Rotate each velocity by +angle and -angle (matching pygame.Vector2.rotate) and speed it up slightly
+    angles = np.radians(rng.uniform(20.0, 50.0, len(radii)))
+    cos = np.cos(angles)
+    sin = np.sin(angles)
+    vx = velocities[:, 0]
+    vy = velocities[:, 1]
+    first = np.stack((vx * cos - vy * sin, vx * sin + vy * cos), axis=1) * 1.2
+    second = np.stack((vx * cos + vy * sin, -vx * sin + vy * cos), axis=1) * 1.2
+
+    asteroids.add_batch(
+        np.concatenate((positions, positions)),
+        np.concatenate((first, second)),
+        np.concatenate((radii, radii)),
+    )
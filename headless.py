@@ -0,0 +1,68 @@
+import os  # Import os to select SDL's dummy drivers before pygame starts
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")  # No window
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")  # No sound device
+
+import argparse  # Import argparse for the command line options
+import random  # Import random to seed the simulation
+import time  # Import time to measure how fast the simulation runs
+from constants import *  # Import constants (SIMULATION_DT is the default step size)
+from inputstate import InputState  # Import the control snapshot fed to the world
+from world import World  # Import the game simulation
+from replay import Recorder, quantize_dt  # Import the input recorder for deterministic replays
+
+# Run the simulation without a display or mixer for a number of fixed-size steps
+# controls is either a single InputState used every step or a function (frame, world) -> InputState
+# world_class picks the engine: World (sprites) or ArrayWorld (NumPy entity stores)
+# If report_every is set, the live entity counts are printed every report_every steps
+# If recorder is a replay Recorder, every step is written to it (seed random before calling)
+def run_headless(frames, dt=SIMULATION_DT, controls=None, world_class=World, report_every=0, recorder=None):
+    if controls is None:  # Default to a player that never touches the keys
+        controls = InputState()
+    next_controls = controls if callable(controls) else (lambda frame, world: controls)
+
+    dt = quantize_dt(dt)  # Use the precision stored in replay files so recordings replay exactly
+    world = world_class()
+    for frame in range(frames):
+        inputs = next_controls(frame, world)
+        world.step(inputs, dt)
+        if recorder:
+            recorder.record(inputs, dt, world)
+        if report_every and world.frame % report_every == 0:
+            print(f"step {world.frame}: {world.entity_counts()}")
+        if world.game_over:  # Stop early once the player has been hit
+            break
+    return world
+
+# Command line entry point: simulate and print how many steps per second were reached
+def main():
+    parser = argparse.ArgumentParser(description="Run the asteroids simulation headless at a fixed timestep.")
+    parser.add_argument("--frames", type=int, default=10000, help="number of steps to simulate")
+    parser.add_argument("--dt", type=float, default=SIMULATION_DT, help="seconds per step")
+    parser.add_argument("--report-every", type=int, default=0, help="print live entity counts every N steps")
+    parser.add_argument("--seed", type=int, default=None, help="seed for the random stream")
+    parser.add_argument("--record", default=None, help="write a replay file of the run")
+    parser.add_argument("--arrays", action="store_true", help="use the NumPy array engine (requires numpy)")
+    args = parser.parse_args()
+
+    world_class = World
+    if args.arrays:
+        from arrayworld import ArrayWorld  # Imported here so numpy is only needed when asked for
+        world_class = ArrayWorld
+
+    seed = args.seed if args.seed is not None else random.randrange(2 ** 63)
+    random.seed(seed)
+    recorder = Recorder(args.record, seed, world_class) if args.record else None
+
+    start = time.perf_counter()
+    world = run_headless(args.frames, args.dt, world_class=world_class, report_every=args.report_every, recorder=recorder)
+    seconds = time.perf_counter() - start
+    if recorder:
+        recorder.close()
+
+    print(f"Simulated {world.frame} steps ({world.elapsed:.1f} s of game time) in {seconds:.2f} s")
+    print(f"{world.frame / seconds:.0f} steps per second, score {world.score}, game over: {world.game_over}")
+    print(f"Live entities: {world.entity_counts()}")
+
+# Run the headless simulation if this script is executed directly
+if __name__ == "__main__":
+    main()
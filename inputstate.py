@@ -0,0 +1,52 @@
+import pygame  # Import pygame for the keyboard key constants
+
+# Bit for each control in the packed form used by replays
+LEFT_BIT = 1
+RIGHT_BIT = 2
+FORWARD_BIT = 4
+BACKWARD_BIT = 8
+FIRE_BIT = 16
+
+# InputState is a snapshot of the controls for a single simulation step
+# The simulation only ever reads this object, so it can be fed by the keyboard, a bot or a replay
+class InputState:
+
+    # Constructor to initialize the control flags (all released by default)
+    def __init__(self, left=False, right=False, forward=False, backward=False, fire=False):
+        self.left = left  # Rotate counter-clockwise
+        self.right = right  # Rotate clockwise
+        self.forward = forward  # Move forward
+        self.backward = backward  # Move backward
+        self.fire = fire  # Fire a shot
+
+    # Build an InputState from the result of pygame.key.get_pressed()
+    @classmethod
+    def from_keys(cls, keys):
+        return cls(
+            left=keys[pygame.K_a],
+            right=keys[pygame.K_d],
+            forward=keys[pygame.K_w],
+            backward=keys[pygame.K_s],
+            fire=keys[pygame.K_SPACE],
+        )
+
+    # Build an InputState from the bitmask produced by to_bits()
+    @classmethod
+    def from_bits(cls, bits):
+        return cls(
+            left=bool(bits & LEFT_BIT),
+            right=bool(bits & RIGHT_BIT),
+            forward=bool(bits & FORWARD_BIT),
+            backward=bool(bits & BACKWARD_BIT),
+            fire=bool(bits & FIRE_BIT),
+        )
+
+    # Pack the controls into a single small integer (one bit per control)
+    def to_bits(self):
+        return (
+            (LEFT_BIT if self.left else 0)
+            | (RIGHT_BIT if self.right else 0)
+            | (FORWARD_BIT if self.forward else 0)
+            | (BACKWARD_BIT if self.backward else 0)
+            | (FIRE_BIT if self.fire else 0)
+        )
@@ -0,0 +1,30 @@
+from constants import *  # Import constants (screen size, despawn margin, lifetimes and caps)
+
+# Check whether an object has drifted further than margin pixels past any edge of the screen
+# Asteroids spawn ASTEROID_MAX_RADIUS outside the screen, so the margin must be larger than that
+# margin defaults to DESPAWN_MARGIN, read at call time so overridden constants take effect
+def is_out_of_bounds(obj, margin=None):
+    if margin is None:
+        margin = DESPAWN_MARGIN
+    x = obj.position.x
+    y = obj.position.y
+    return x < -margin or x > SCREEN_WIDTH + margin or y < -margin or y > SCREEN_HEIGHT + margin
+
+# Remove objects in a sprite group that left the play area or outlived max_lifetime,
+# then, if the group is still larger than cap, remove the oldest until it fits
+# Returns the number of objects removed
+def cull(group, max_lifetime, cap, margin=None):
+    if margin is None:
+        margin = DESPAWN_MARGIN
+    removed = 0
+    for obj in group.sprites():  # sprites() returns a copy, so killing while looping is safe
+        if obj.age > max_lifetime or is_out_of_bounds(obj, margin):
+            obj.kill()
+            removed += 1
+
+    excess = len(group) - cap
+    if excess > 0:
+        for obj in sorted(group.sprites(), key=lambda obj: obj.age, reverse=True)[:excess]:
+            obj.kill()
+        removed += excess
+    return removed
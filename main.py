@@ -1,28 +1,21 @@
 import pygame  # Import the pygame library for game development
 import sys  # Import the sys library to handle system-specific parameters (e.g., for exiting the game)
-import os  # Import the os library for working with file paths
+import random  # Import random to seed the game so a session can be recorded and replayed
 from constants import *  # Import constants (such as screen dimensions, player stats, etc.)
-from player import *  # Import the Player class from player.py
-from asteroid import *  # Import the Asteroid class from asteroid.py
-from asteroidfield import *  # Import the AsteroidField class from asteroidfield.py
-from pygame.mixer import Sound  # Import Sound class from pygame.mixer for handling sounds
+from world import World  # Import the game simulation
+from inputstate import InputState  # Import the control snapshot fed to the simulation
+from profiler import FrameProfiler  # Import the per-phase frame timer
+from renderer import *  # Import the full-screen and dirty-rect renderers
+from replay import Recorder, quantize_dt  # Import the input recorder for deterministic replays
+from assets import registry, MUSIC_FILES  # Import the shared asset registry and the music track list
+from audio import audio_manager  # Import the shared audio manager
 
 running = False  # Variable to track whether the game is running
 
 # Function to handle background music playback
-def play_background_music(background_music, channel):
-    current_index = 0  # Start with the first song
-
-    # Function to play the next sound in the list
-    def play_next_sound():
-        nonlocal current_index
-        channel.play(background_music[current_index])  # Play the current song
-        current_index = (current_index + 1) % len(background_music)  # Cycle through the music list
-
-    channel.set_endevent(pygame.USEREVENT)  # Set an event to trigger when the sound ends
-    play_next_sound()  # Play the first sound immediately
-
-    running = True  # Indicate that the game is running
+# The audio manager streams the next track whenever the music stream posts its end event (USEREVENT)
+def play_background_music(background_music):
+    audio_manager.play_music(background_music)
 
 # Main game loop
 def main():
@@ -31,101 +24,143 @@ def main():
     pygame.mixer.init()  # Initialize pygame's sound mixer
 
     font = pygame.font.SysFont("Arial", 30)  # Create a font for rendering text (score, etc.)
-
-    # Load background music files
-    sound1 = Sound("sounds/SongA.wav")
-    sound2 = Sound("sounds/SongB.wav")
-    sound3 = Sound("sounds/SongC.wav")
-    background_music = [sound1, sound2, sound3]  # List of music tracks
-
-    channel = pygame.mixer.Channel(0)  # Create a channel for background music
+    overlay_font = pygame.font.SysFont("Courier", 16)  # Monospaced font for the profiler overlay
 
     # Set up the game screen (width and height from constants)
+    # This must happen before loading images so the registry can convert them to the display format
     screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
 
-    # Load and scale the background image
-    backdrop = pygame.image.load(os.path.join('images', 'A_CompleteSpaceBackground.png'))
-    backdrop = pygame.transform.scale(backdrop, (SCREEN_WIDTH, SCREEN_HEIGHT))
-    backdropbox = screen.get_rect()  # Get the rect (bounding box) for the backdrop (for positioning)
-
-    score = 0  # Initialize score
-    # Load the background image for the score box
-    score_background_image = pygame.image.load(os.path.join('images', 'list_box.png'))
-    score_background_image = pygame.transform.scale(score_background_image, (200, 50))
+    # Load every sprite image and sound effect once, before the first frame
+    registry.preload()
+    audio_manager.start()  # Set up the sound effect channel pool
 
-    # Create sprite groups for managing different types of objects
-    updatable = pygame.sprite.Group()  # Group for objects that need to be updated each frame
-    drawable = pygame.sprite.Group()  # Group for objects that need to be drawn each frame
-    asteroids = pygame.sprite.Group()  # Group for asteroids
-    shots = pygame.sprite.Group()  # Group for shots
+    # Background music tracks (streamed while they play, nothing is decoded here)
+    background_music = MUSIC_FILES
 
-    # Set up the containers for Asteroid and AsteroidField classes
-    Asteroid.containers = (asteroids, updatable, drawable)
-    AsteroidField.containers = updatable
-    asteroid_field = AsteroidField()  # Create an AsteroidField object
+    # Get the screen-sized background image and the score box image from the preprocessed asset cache
+    # (the first start, or a changed source image, rebuilds the cache)
+    registry.load_screen_images()
+    backdrop = registry.image("backdrop")
+    score_background_image = registry.image("score_box")
 
-    # Set up the containers for Player and Shot classes
-    Player.containers = (updatable, drawable)
-    Shot.containers = (shots, updatable, drawable)
+    # Draw every frame in full, or with --dirty-rects only redraw and push the regions that changed
+    if "--dirty-rects" in sys.argv:
+        renderer = DirtyRectRenderer(screen, backdrop, score_background_image, font)
+    else:
+        renderer = FullRenderer(screen, backdrop, score_background_image, font)
 
-    player = Player(SCREEN_WIDTH / 2, SCREEN_HEIGHT / 2)  # Create the player at the center of the screen
+    if "--asset-report" in sys.argv:  # Print per-asset load times and memory use when asked
+        registry.print_report()
 
-    game_clock = pygame.time.Clock()  # Create a clock to control the game's frame rate
-    dt = 0  # Delta time (time between frames)
-
-    play_background_music(background_music, channel)  # Start playing background music
+    # Seed the random stream (--seed N to pick one) so the session can be reproduced from its inputs
+    seed = random.randrange(2 ** 63)
+    if "--seed" in sys.argv:
+        seed = int(sys.argv[sys.argv.index("--seed") + 1])
+    random.seed(seed)
 
-    while(True):
-        # Clear the screen by drawing the background
-        screen.blit(backdrop, (0,0))
+    world = World()  # Create the game simulation (sprite groups, asteroid field, player and collisions)
 
-        # Render the score as text
-        score_text = font.render(f"Score: {score}", True, (255, 255, 255))
+    # Record the seed, inputs and dts to a replay file with --record file.replay
+    recorder = None
+    if "--record" in sys.argv:
+        recorder = Recorder(sys.argv[sys.argv.index("--record") + 1], seed)
 
-        # Position for the score text
-        text_rect = score_text.get_rect(center=(110,35))
+    trace_path = None  # Where to write the per-frame trace on exit (--trace file.csv or file.json)
+    if "--trace" in sys.argv:
+        trace_path = sys.argv[sys.argv.index("--trace") + 1]
 
-        # Draw the background image for the score box (places it behind the score text)
-        screen.blit(score_background_image, (10,10))
+    # Time every phase of every frame (press F3 to show the overlay)
+    # The full per-frame trace is only kept when it will be written out
+    profiler = FrameProfiler(keep_trace=bool(trace_path))
+    world.profiler = profiler  # Let the world time its update and collision phases
 
-        # Draw the score text on top of the score box image
-        screen.blit(score_text, text_rect)
-
-        # Update all updatable objects (e.g., player, asteroids, shots)
-        for obj in updatable:
-            obj.update(dt)
+    game_clock = pygame.time.Clock()  # Create a clock to control the game's frame rate
+    dt = 0  # Delta time (time between frames)
 
-        # Check for collisions between the player and asteroids
-        for asteroid in asteroids:
-            if asteroid.collision(player):  # If the player collides with an asteroid
-                player.death()  # Call the death method on the player
+    # The simulation always advances in fixed SIMULATION_DT steps, however long a frame takes,
+    # so a slow frame runs more steps instead of one big step that lets fast shots tunnel through asteroids
+    # The step is rounded to the precision stored in replay files so a recording replays exactly
+    step_dt = quantize_dt(SIMULATION_DT)
+    accumulator = 0.0  # Frame time not yet simulated
+
+    play_background_music(background_music)  # Start playing background music
+
+    dying = False  # Set once the player has been hit
+
+    try:
+        while(True):
+            # Clear the screen by drawing the background
+            with profiler.phase("background"):
+                renderer.draw_background()
+
+            # Draw the score box with the score text on top (the text is only re-rendered when the score changes)
+            with profiler.phase("score"):
+                renderer.draw_score(world.score)
+
+            # Advance the simulation by the time that has passed, in fixed steps, using the current keyboard state
+            # A very long frame (e.g. the window being dragged) is clamped to MAX_FRAME_TIME, and at most
+            # MAX_CATCHUP_STEPS run per frame; time beyond that is dropped so a slow machine can't fall ever further behind
+            inputs = InputState.from_keys(pygame.key.get_pressed())
+            accumulator += min(dt, MAX_FRAME_TIME)
+            steps = 0
+            while accumulator >= step_dt and steps < MAX_CATCHUP_STEPS and not world.game_over:
+                world.step(inputs, step_dt)  # Times its own update and collision phases
+                if recorder:
+                    recorder.record(inputs, step_dt, world)
+                accumulator -= step_dt
+                steps += 1
+            if steps == MAX_CATCHUP_STEPS:
+                accumulator = min(accumulator, step_dt)
+
+            # How far this frame is between the last step and the next one, used to draw positions in between
+            alpha = min(accumulator / step_dt, 1.0)
+
+            # Check whether an asteroid hit the player during this step
+            if world.game_over and not dying:
+                world.player.death()  # Call the death method on the player (queues the death sound)
                 print("Game over!")  # Print game over message
+                dying = True  # Keep drawing frames until the death sound has finished
+
+            # Draw all drawable objects (e.g., player, asteroids, shots)
+            with profiler.phase("draw"):
+                renderer.draw_world(world, alpha)
+                renderer.draw_overlay(profiler, overlay_font)
+
+            # Handle all events (e.g., quit the game, music end event)
+            with profiler.phase("events"):
+                for event in pygame.event.get():
+                    if event.type == pygame.QUIT:  # If the window is closed
+                        running = False  # Stop the game
+                        return  # Exit the main loop
+                    elif event.type == pygame.KEYDOWN and event.key == pygame.K_F3:  # Toggle the profiler overlay
+                        profiler.toggle_overlay()
+                    elif event.type == pygame.USEREVENT:  # If background music ends
+                        audio_manager.handle_event(event)  # Move on to the next track
+
+            # Play the sounds queued during this frame
+            with profiler.phase("audio"):
+                audio_manager.dispatch()
+
+            # Exit once the death sound is over (straight away if there is no sound)
+            if dying and not audio_manager.is_playing("death"):
                 sys.exit()  # Exit the game
 
-            # Check for collisions between shots and asteroids
-            for shot in shots:
-                if asteroid.collision(shot):  # If a shot hits an asteroid
-                    score += 1  # Increase the score
-                    shot.kill()  # Remove the shot
-                    asteroid.split()  # Split the asteroid into smaller pieces
-
-        # Draw all drawable objects (e.g., player, asteroids, shots)
-        for obj in drawable:
-            obj.draw(screen)
-
-        # Handle all events (e.g., quit the game, music end event)
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:  # If the window is closed
-                running = False  # Stop the game
-                return  # Exit the main loop
-            elif event.type == pygame.USEREVENT:  # If background music ends
-                pass  # You can add behavior here if needed
-
-        # Update the display to show the new frame
-        pygame.display.flip()
-
-        # Get the time delta (time elapsed since the last frame) and regulate the game to run at 60 FPS
-        dt = game_clock.tick(60) / 1000  # dt is the time elapsed since the last frame (in seconds)
+            # Update the display to show the new frame
+            with profiler.phase("flip"):
+                renderer.present()
+
+            # Record this frame's phase times and sprite group sizes
+            profiler.end_frame(world.entity_counts())
+
+            # Get the time delta (time elapsed since the last frame) and cap drawing at 60 FPS
+            dt = game_clock.tick(60) / 1000  # dt is the time elapsed since the last frame (in seconds), fed to the accumulator
+    finally:
+        # Print the rolling percentiles and write the trace, however the game ended
+        profiler.print_summary()
+        if trace_path:
+            profiler.write_trace(trace_path)
+        if recorder:
+            recorder.close()
 
 # Run the main game loop if this script is executed directly
 if __name__ == "__main__":
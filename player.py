@@ -1,7 +1,9 @@
 from circleshape import *  # Import the CircleShape class to inherit position and radius properties for the player
 from constants import *     # Import constants like PLAYER_RADIUS, PLAYER_TURN_SPEED, PLAYER_SPEED, etc.
 from shot import *          # Import the Shot class to create shots fired by the player
-from pygame.mixer import Sound  # Import Pygame's sound module to play sound effects
+from inputstate import InputState  # Import the control snapshot the player reads each step
+from assets import registry     # Import the shared asset registry for images
+from audio import audio_manager # Import the shared audio manager for sound effects
 
 class Player(CircleShape):  # Player class inherits from CircleShape (for position and radius)
     def __init__(self, x, y):
@@ -11,31 +13,30 @@ class Player(CircleShape):  # Player class inherits from CircleShape (for positi
         # Initialize the player's rotation angle and shot timer
         self.rotation = 0  # The initial rotation is 0 degrees
         self.shot_timer = 0  # Timer to control the rate of fire
+        self.controls = InputState()  # Controls for the current step (set by the World before each update)
+        self.shot_store = None  # EntityStore that receives shots in the array engine (None creates Shot sprites)
 
-        # Load the image for the player and store a reference to the original image for later rotation
-        self.image = pygame.image.load("images/Blue_Player_Ship_1.png")
+        # Get the shared image for the player and store a reference to the original image for later rotation
+        self.image = registry.image("Blue_Player_Ship_1")
         self.original_image = self.image
+        self.rotations = registry.rotations("Blue_Player_Ship_1")  # Pre-rendered frames for every angle
         self.rect = self.image.get_rect(center = self.position)  # Create a rectangle for the image, centered at the player's position
 
-        # Set up sound channels for shooting and death sound effects
-        self.shoot_channel = pygame.mixer.Channel(1)
-        self.death_channel = pygame.mixer.Channel(2)
-
-        # Load sound files for shooting and death events
-        self.shoot_sound = Sound("sounds/PlayerFire.wav")
-        self.death_sound = Sound("sounds/PlayerExplode.wav")
-
-    def draw(self, screen):
-        # This method is responsible for drawing the player image on the screen at the player's current position
-        screen.blit(self.image, self.rect)
+    def draw(self, screen, alpha=1.0):
+        # This method is responsible for drawing the player image on the screen at the player's current (or interpolated) position
+        # Returns the rect that was drawn over (used by the dirty-rect renderer)
+        rect = self.rect
+        if alpha < 1.0:  # Between two steps: draw part of the way from the previous position
+            rect = self.image.get_rect(center=self.render_position(alpha))
+        return screen.blit(self.image, rect)
 
     def rotate(self, dt):
         # This method rotates the player image by adjusting the rotation angle over time
         # PLAYER_TURN_SPEED * dt is the amount to rotate each frame (scaled by delta time)
         self.rotation += (PLAYER_TURN_SPEED * dt)
         
-        # Rotate the original player image by the specified angle (counter-clockwise)
-        self.image = pygame.transform.rotate(self.original_image, -self.rotation)
+        # Look up the pre-rendered player image for the new angle (counter-clockwise)
+        self.image = self.rotations.frame(-self.rotation)
 
         # Update the player's rectangle to account for the rotation and re-center it on the player's position
         self.rect = self.image.get_rect(center=self.position)
@@ -43,20 +44,21 @@ class Player(CircleShape):  # Player class inherits from CircleShape (for positi
     def update(self, dt):
         # This method updates the player state based on input and time (delta time)
         self.shot_timer -= dt  # Decrease the shot timer by delta time to handle cooldown
+        self.previous_position.update(self.position)  # Remember where the player was (for interpolated drawing)
 
-        # Get the current key states (whether keys are being pressed)
-        keys = pygame.key.get_pressed()
+        # Get the controls for this step (keyboard, bot or replay, the player doesn't care which)
+        controls = self.controls
 
-        # Handle player movement and rotation based on key presses
-        if keys[pygame.K_a]:  # Rotate left (counter-clockwise)
+        # Handle player movement and rotation based on the controls
+        if controls.left:  # Rotate left (counter-clockwise)
             self.rotate(-dt)
-        if keys[pygame.K_d]:  # Rotate right (clockwise)
+        if controls.right:  # Rotate right (clockwise)
             self.rotate(dt)
-        if keys[pygame.K_w]:  # Move forward
+        if controls.forward:  # Move forward
             self.move(-dt)
-        if keys[pygame.K_s]:  # Move backward
+        if controls.backward:  # Move backward
             self.move(dt)
-        if keys[pygame.K_SPACE]:  # Fire a shot if the spacebar is pressed
+        if controls.fire:  # Fire a shot if the fire control is held
             self.shoot()
 
     def move(self, dt):
@@ -80,16 +82,16 @@ class Player(CircleShape):  # Player class inherits from CircleShape (for positi
         self.shot_timer = PLAYER_SHOOT_COOLDOWN
         
         # Create a new shot at the player's current position and with the player's rotation
-        Shot(self.position.x, self.position.y, self.rotation)
+        if self.shot_store is not None:  # Array engine: queue the shot instead of creating a sprite
+            velocity = pygame.Vector2(0, 1).rotate(self.rotation + 180) * PLAYER_SHOOT_SPEED
+            self.shot_store.append(self.position.x, self.position.y, velocity.x, velocity.y, SHOT_RADIUS)
+        else:
+            Shot.create(self.position.x, self.position.y, self.rotation)
         
-        # Play the shooting sound effect
-        self.shoot_channel.play(self.shoot_sound)
+        # Queue the shooting sound effect (played by the audio manager at the end of the frame)
+        audio_manager.play("PlayerFire", "player")
 
     def death(self):
-        # This method handles the player's death and plays the death sound
-        if self.death_sound:  # If a death sound is defined, play it
-            self.death_channel.play(self.death_sound)
-            
-            # Wait for the death sound to finish before continuing
-            while self.death_channel.get_busy():
-                pygame.time.delay(1)  # Wait for 1 millisecond to avoid freezing the game
+        # This method handles the player's death and queues the death sound
+        # It does not wait for the sound; the game loop checks audio_manager.is_playing("death") instead
+        audio_manager.play("PlayerExplode", "death")
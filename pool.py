@@ -0,0 +1,35 @@
+# ObjectPool recycles killed sprites so they can be reinitialized in place instead of reallocated
+# The pooled class must provide reset(*args) taking the same arguments as its constructor
+class ObjectPool:
+
+    # Constructor to set up an empty pool for the given class
+    # size is the most killed objects kept for reuse; any beyond that are left to the garbage collector
+    def __init__(self, cls, size):
+        self.cls = cls  # Class of the pooled objects
+        self.size = size  # Maximum length of the free list
+        self.free = []  # Killed objects waiting to be reused
+        self.created = 0  # Number of objects constructed by this pool
+        self.reused = 0  # Number of objects handed out from the free list
+
+    # Construct count objects up front (with placeholder constructor arguments) and park them on the free list
+    def prewarm(self, count, *args):
+        for _ in range(min(count, self.size - len(self.free))):
+            obj = self.cls(*args)
+            self.created += 1
+            obj.kill()  # Takes it out of its sprite groups and hands it back to this pool
+
+    # Get an object initialized with args, reusing a killed one when available
+    def acquire(self, *args):
+        if not self.free:  # Nothing to reuse, build a new one
+            self.created += 1
+            return self.cls(*args)
+        obj = self.free.pop()
+        obj.reset(*args)  # Reinitialize in place
+        obj.add(obj.containers)  # Put it back into the sprite groups it was removed from
+        self.reused += 1
+        return obj
+
+    # Take back a killed object (called from CircleShape.kill)
+    def release(self, obj):
+        if len(self.free) < self.size:
+            self.free.append(obj)
@@ -0,0 +1,121 @@
+import csv  # Import csv for writing the trace as a spreadsheet-friendly file
+import json  # Import json for writing the trace as JSON
+import math  # Import math to round percentile ranks up
+import time  # Import time for the high resolution timer
+from collections import deque  # Import deque for the rolling window of recent frames
+from contextlib import contextmanager  # Import contextmanager to build the phase timer
+import pygame  # Import pygame for drawing the overlay
+from constants import *  # Import constants (PROFILER_WINDOW sets the rolling window size)
+
+# Percentiles reported by the summary and the overlay
+PERCENTILES = (50, 95, 99)
+
+# Get the p-th percentile of a list of numbers (nearest-rank method: the value at rank ceil(p/100 * n))
+def percentile(values, p):
+    ordered = sorted(values)
+    index = max(0, min(len(ordered) - 1, math.ceil(p / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+# FrameProfiler times each phase of a frame and records entity counts per sprite group
+# It keeps a rolling window for the overlay and summary, and (if keep_trace is set) the full trace for writing on exit
+class FrameProfiler:
+
+    # Constructor to initialize an empty profile
+    # Without keep_trace only the rolling window is kept, so memory stays flat however long the game runs
+    def __init__(self, window=PROFILER_WINDOW, keep_trace=True):
+        self.phases = []  # Phase names in the order they were first seen (the trace columns)
+        self.current = {}  # Milliseconds spent in each phase during the frame being recorded
+        self.frame_start = time.perf_counter()  # When the frame being recorded started
+        self.recent = deque(maxlen=window)  # Per-frame dicts for the last `window` frames
+        self.keep_trace = keep_trace  # Whether every frame is kept for write_trace()
+        self.trace = []  # Every recorded frame (when keep_trace is set), written out by write_trace()
+        self.overlay_visible = False  # Whether draw_overlay() shows anything
+
+    # Time the code inside a `with profiler.phase(name):` block and add it to the current frame
+    @contextmanager
+    def phase(self, name):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = (time.perf_counter() - start) * 1000
+            if name not in self.current:
+                if name not in self.phases:
+                    self.phases.append(name)
+                self.current[name] = 0.0
+            self.current[name] += elapsed
+
+    # Finish the current frame: store its phase times, total time and entity counts, then start the next one
+    def end_frame(self, counts):
+        now = time.perf_counter()
+        frame = dict(self.current)
+        frame["frame"] = (now - self.frame_start) * 1000
+        frame["counts"] = dict(counts)
+        self.recent.append(frame)
+        if self.keep_trace:
+            self.trace.append(frame)
+        self.current = {}
+        self.frame_start = now
+
+    # Build {phase: {"p50": ms, "p95": ms, "p99": ms}} over the rolling window (plus the whole frame)
+    def summary(self):
+        result = {}
+        for name in self.phases + ["frame"]:
+            values = [frame.get(name, 0.0) for frame in self.recent]
+            if values:
+                result[name] = {f"p{p}": percentile(values, p) for p in PERCENTILES}
+        return result
+
+    # Show or hide the overlay
+    def toggle_overlay(self):
+        self.overlay_visible = not self.overlay_visible
+
+    # Draw the rolling percentiles and the latest entity counts in the top right corner
+    # Returns the rect covered by the overlay, or None when nothing was drawn
+    def draw_overlay(self, screen, font):
+        if not self.overlay_visible or not self.recent:
+            return None
+        lines = ["phase        p50    p95    p99 ms"]
+        for name, stats in self.summary().items():
+            lines.append(f"{name:<10} {stats['p50']:6.2f} {stats['p95']:6.2f} {stats['p99']:6.2f}")
+        for group, count in self.recent[-1]["counts"].items():
+            lines.append(f"{group:<10} {count:6d}")
+
+        x = SCREEN_WIDTH - 360
+        y = 10
+        covered = pygame.Rect(x, y, 0, 0)
+        for line in lines:
+            text = font.render(line, True, (255, 255, 0))
+            covered.union_ip(screen.blit(text, (x, y)))
+            y += text.get_height()
+        return covered
+
+    # Write every recorded frame to path: JSON if it ends in .json, otherwise CSV
+    def write_trace(self, path):
+        if path.endswith(".json"):
+            with open(path, "w") as trace_file:
+                json.dump({"phases": self.phases, "summary": self.summary(), "frames": self.trace}, trace_file)
+            return
+
+        groups = sorted({group for frame in self.trace for group in frame["counts"]})
+        with open(path, "w", newline="") as trace_file:
+            writer = csv.writer(trace_file)
+            writer.writerow(self.phases + ["frame"] + groups)
+            for frame in self.trace:
+                writer.writerow(
+                    [f"{frame.get(name, 0.0):.4f}" for name in self.phases + ["frame"]]
+                    + [frame["counts"].get(group, 0) for group in groups]
+                )
+
+    # Print the rolling percentiles, one phase per line
+    def print_summary(self):
+        for name, stats in self.summary().items():
+            print(f"{name:<10} p50 {stats['p50']:7.3f} ms  p95 {stats['p95']:7.3f} ms  p99 {stats['p99']:7.3f} ms")
+
+# NullProfiler has the same phase() interface but records nothing (the default for a World)
+class NullProfiler:
+
+    # Time nothing, just run the block
+    @contextmanager
+    def phase(self, name):
+        yield
@@ -0,0 +1,110 @@
+import pygame  # Import pygame for blitting and updating the display
+
+# Position of the score box and its text on the screen
+SCORE_BOX_POSITION = (10, 10)
+SCORE_TEXT_CENTER = (110, 35)
+
+# FullRenderer redraws the whole screen every frame and flips the display
+# The score text is only re-rendered when the score changes
+class FullRenderer:
+
+    # Constructor to keep the surfaces used for every frame
+    def __init__(self, screen, backdrop, score_background_image, font):
+        self.screen = screen  # The display surface
+        self.backdrop = backdrop  # Screen-sized background image
+        self.score_background_image = score_background_image  # Image drawn behind the score
+        self.font = font  # Font used for the score text
+        self.score_box = score_background_image.get_rect(topleft=SCORE_BOX_POSITION)  # Area covered by the score box
+        self.score = None  # Score the cached text was rendered for
+        self.score_text = None  # Cached rendered score text
+        self.score_text_rect = None  # Where the cached score text is drawn
+
+    # Render the score text again only if the score changed; returns True if it did
+    def update_score_text(self, score):
+        if score == self.score:
+            return False
+        self.score = score
+        self.score_text = self.font.render(f"Score: {score}", True, (255, 255, 255))
+        self.score_text_rect = self.score_text.get_rect(center=SCORE_TEXT_CENTER)
+        return True
+
+    # Clear the screen by drawing the background
+    def draw_background(self):
+        self.screen.blit(self.backdrop, (0, 0))
+
+    # Draw the score box and the score text on top of it
+    def draw_score(self, score):
+        self.update_score_text(score)
+        self.screen.blit(self.score_background_image, self.score_box)
+        self.screen.blit(self.score_text, self.score_text_rect)
+
+    # Draw the world's objects, alpha of the way between the last two simulation steps
+    def draw_world(self, world, alpha=1.0):
+        world.draw(self.screen, alpha)
+
+    # Draw the profiler overlay (if it is visible)
+    def draw_overlay(self, profiler, font):
+        profiler.draw_overlay(self.screen, font)
+
+    # Show the finished frame
+    def present(self):
+        pygame.display.flip()
+
+# DirtyRectRenderer only touches the parts of the screen that changed since the last frame:
+# it restores the backdrop under last frame's sprites, redraws the score box only when needed,
+# and pushes just those rectangles to the display with pygame.display.update(rects)
+class DirtyRectRenderer(FullRenderer):
+
+    # Constructor to set up the dirty rectangle bookkeeping
+    def __init__(self, screen, backdrop, score_background_image, font):
+        super().__init__(screen, backdrop, score_background_image, font)
+        self.previous_rects = []  # Rects the sprites (and overlay) covered last frame
+        self.current_rects = []  # Rects the sprites (and overlay) cover this frame
+        self.dirty = []  # Every rect that must be pushed to the display this frame
+        self.score_box_dirty = True  # Whether the score box must be redrawn this frame
+        self.full_redraw = True  # The very first frame draws the whole screen
+
+    # Restore the backdrop only where sprites were drawn last frame
+    def draw_background(self):
+        if self.full_redraw:
+            self.screen.blit(self.backdrop, (0, 0))
+            return
+        for rect in self.previous_rects:
+            self.screen.blit(self.backdrop, rect, rect)  # Copy just this area of the backdrop
+            if rect.colliderect(self.score_box):  # A sprite was over the score box, so it was erased
+                self.score_box_dirty = True
+        self.dirty.extend(self.previous_rects)
+
+    # Redraw the score box only if the score changed or a sprite erased part of it
+    def draw_score(self, score):
+        if self.update_score_text(score) or self.score_box_dirty or self.full_redraw:
+            # The box image is translucent, so put the backdrop back under it before drawing over the old text
+            self.screen.blit(self.backdrop, self.score_box, self.score_box)
+            self.screen.blit(self.score_background_image, self.score_box)
+            self.screen.blit(self.score_text, self.score_text_rect)
+            self.dirty.append(self.score_box)
+            self.score_box_dirty = False
+
+    # Draw the world's objects and remember where they went
+    def draw_world(self, world, alpha=1.0):
+        rects = world.draw(self.screen, alpha)
+        self.current_rects.extend(rects)
+        self.dirty.extend(rects)
+
+    # Draw the profiler overlay and treat it like a sprite so it is erased when hidden
+    def draw_overlay(self, profiler, font):
+        rect = profiler.draw_overlay(self.screen, font)
+        if rect:
+            self.current_rects.append(rect)
+            self.dirty.append(rect)
+
+    # Push only the changed rectangles to the display
+    def present(self):
+        if self.full_redraw:
+            pygame.display.flip()
+            self.full_redraw = False
+        else:
+            pygame.display.update(self.dirty)
+        self.previous_rects = self.current_rects
+        self.current_rects = []
+        self.dirty = []
@@ -0,0 +1,129 @@
+import os  # Import os to select SDL's dummy drivers for command line playback
+import argparse  # Import argparse for the command line options
+import random  # Import random to seed the game's random stream
+import struct  # Import struct for the binary replay format
+import time  # Import time for real-time playback and timing
+from constants import *  # Import constants (REPLAY_HASH_INTERVAL is the default hash spacing)
+from inputstate import InputState  # Import the control snapshot and its bitmask form
+from world import World  # Import the game simulation
+
+# Replay file layout (little endian):
+#   header: magic b"ASTR", version (u16), engine (u8, 0 = World, 1 = ArrayWorld), hash interval (u32), seed (u64)
+#   then one record per frame: input bitmask (u8) and dt (f32)
+#   if HASH_FLAG is set in the bitmask, the world's state hash after that frame follows (u64)
+MAGIC = b"ASTR"
+VERSION = 1
+HEADER = struct.Struct("<4sHBIQ")
+FRAME = struct.Struct("<Bf")
+HASH = struct.Struct("<Q")
+HASH_FLAG = 0x80  # Not used by any control bit in InputState
+
+# Engines a replay can be recorded with
+ENGINES = ["World", "ArrayWorld"]
+
+# Raised when a replayed world's state hash differs from the recorded one
+class ReplayDesyncError(Exception):
+    pass
+
+# Round a dt to the 32-bit float stored in the file
+# The recording must step with this value too, otherwise the replay would drift
+def quantize_dt(dt):
+    return FRAME.unpack(FRAME.pack(0, dt))[1]
+
+# Get the engine class for an engine id, importing ArrayWorld only when it is needed
+def engine_class(engine):
+    if ENGINES[engine] == "ArrayWorld":
+        from arrayworld import ArrayWorld
+        return ArrayWorld
+    return World
+
+# Recorder writes the seed, every frame's inputs and dt, and periodic state hashes to a replay file
+# Usage: seed random, build the world, then each frame quantize dt, step the world and call record()
+class Recorder:
+
+    # Constructor to open the file and write the header
+    def __init__(self, path, seed, world_class=World, hash_interval=REPLAY_HASH_INTERVAL):
+        self.file = open(path, "wb")
+        self.hash_interval = hash_interval  # Frames between state hashes
+        self.file.write(HEADER.pack(MAGIC, VERSION, ENGINES.index(world_class.__name__), hash_interval, seed))
+
+    # Write one frame: the inputs and (quantized) dt that were just passed to world.step
+    def record(self, inputs, dt, world):
+        bits = inputs.to_bits()
+        check = world.frame % self.hash_interval == 0
+        if check:
+            bits |= HASH_FLAG
+        self.file.write(FRAME.pack(bits, dt))
+        if check:
+            self.file.write(HASH.pack(world.state_hash()))
+
+    # Flush and close the file
+    def close(self):
+        self.file.close()
+
+# Read a replay file's header and frame records
+# Returns (seed, engine, frames) where frames is a list of (InputState, dt, expected hash or None)
+def load_replay(path):
+    with open(path, "rb") as replay_file:
+        data = replay_file.read()
+    magic, version, engine, hash_interval, seed = HEADER.unpack_from(data, 0)
+    if magic != MAGIC or version != VERSION:
+        raise ValueError(f"{path} is not a version {VERSION} replay file")
+
+    frames = []
+    offset = HEADER.size
+    while offset < len(data):
+        bits, dt = FRAME.unpack_from(data, offset)
+        offset += FRAME.size
+        expected = None
+        if bits & HASH_FLAG:
+            expected = HASH.unpack_from(data, offset)[0]
+            offset += HASH.size
+        frames.append((InputState.from_bits(bits & ~HASH_FLAG), dt, expected))
+    return seed, engine, frames
+
+# Feed a replay file back through World.step and check the state hashes
+# With realtime=True each step waits for its dt to pass, otherwise it runs as fast as possible
+# Raises ReplayDesyncError at the first hash that does not match; returns the world and hashes checked
+def run_replay(path, realtime=False):
+    seed, engine, frames = load_replay(path)
+    random.seed(seed)  # Same seed as the recording, before anything draws random numbers
+    world = engine_class(engine)()
+
+    checked = 0
+    start = time.perf_counter()
+    game_time = 0.0
+    for inputs, dt, expected in frames:
+        world.step(inputs, dt)
+        if expected is not None:
+            actual = world.state_hash()
+            if actual != expected:
+                raise ReplayDesyncError(f"state hash mismatch at frame {world.frame}: expected {expected:016x}, got {actual:016x}")
+            checked += 1
+        if realtime:
+            game_time += dt
+            delay = game_time - (time.perf_counter() - start)
+            if delay > 0:
+                time.sleep(delay)
+    return world, checked
+
+# Command line entry point: replay a file and report whether it stayed in sync
+def main():
+    # Replays never need a window or a sound device (set here, not at import, because main.py imports the Recorder)
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+    parser = argparse.ArgumentParser(description="Replay a recorded asteroids session and verify its state hashes.")
+    parser.add_argument("path", help="replay file written with --record")
+    parser.add_argument("--realtime", action="store_true", help="play back at the recorded speed")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    world, checked = run_replay(args.path, args.realtime)
+    seconds = time.perf_counter() - start
+    print(f"Replayed {world.frame} steps in {seconds:.2f} s ({world.frame / max(seconds, 1e-9):.0f} steps per second)")
+    print(f"{checked} state hashes verified, score {world.score}, game over: {world.game_over}")
+
+# Run the replay if this script is executed directly
+if __name__ == "__main__":
+    main()
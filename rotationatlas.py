@@ -0,0 +1,21 @@
+import pygame  # Import pygame for rotating surfaces
+from constants import *  # Import constants (ROTATION_STEPS sets the default number of angles)
+
+# RotationAtlas pre-renders an image at evenly spaced angles so sprites can look frames up
+# instead of calling pygame.transform.rotate every frame
+class RotationAtlas:
+
+    # Constructor to build every rotated frame of the source image once
+    def __init__(self, image, steps=ROTATION_STEPS):
+        self.steps = steps  # Number of frames covering a full turn
+        self.step_angle = 360 / steps  # Degrees between two neighbouring frames
+        # Frame i holds the image rotated counter-clockwise by i * step_angle degrees
+        self.frames = [pygame.transform.rotate(image, i * self.step_angle) for i in range(steps)]
+
+    # Get the pre-rendered frame closest to the given counter-clockwise angle in degrees
+    def frame(self, angle):
+        return self.frames[round(angle / self.step_angle) % self.steps]
+
+    # Total memory used by all frames in bytes (reported alongside the other assets)
+    def byte_size(self):
+        return sum(frame.get_pitch() * frame.get_height() for frame in self.frames)
@@ -1,37 +1,56 @@
 from circleshape import *  # Import the CircleShape class, presumably to define the shot's shape
 from constants import *     # Import constants like SHOT_RADIUS and PLAYER_SHOOT_SPEED
+from assets import registry # Import the shared asset registry for the projectile image
 
 class Shot(CircleShape):  # Shot class inherits from CircleShape (likely to inherit position and radius properties)
     def __init__(self, x, y, rotation):
         # Initialize the shot by calling the superclass constructor to set its position and radius
         super().__init__(x, y, SHOT_RADIUS)
 
-        # Set the velocity of the shot based on the rotation angle passed in, adding 180 to reverse direction
-        # The vector (0, 1) represents the "forward" direction, then we rotate it to match the player's rotation
-        # and scale it by the PLAYER_SHOOT_SPEED constant to determine how fast it moves.
-        self.velocity = pygame.Vector2(0, 1).rotate(rotation + 180) * PLAYER_SHOOT_SPEED
-        
-        # Load the projectile image to represent the shot
-        self.image = pygame.image.load("images/Projectile_1_Blue_Small.png")
-        self.original_image = self.image  # Store the original image so it can be rotated later
+        # Get the shared projectile image to represent the shot
+        self.image = registry.image("Projectile_1_Blue_Small")
+        self.original_image = self.image  # Store the original image
+        self.rotations = registry.rotations("Projectile_1_Blue_Small")  # Pre-rendered frames for every angle
 
         # Create a rectangle (rect) for the image, centered at the shot's position
         self.rect = self.image.get_rect(center = self.position)
 
-    def draw(self, screen):
-        # Rotate the image according to its velocity (angle of movement)
+        self.aim(rotation)  # Point the shot in the direction it was fired
+
+    def reset(self, x, y, rotation):
+        # Reinitialize a recycled shot in place with a new position and direction
+        super().reset(x, y, SHOT_RADIUS)
+        self.aim(rotation)
+
+    def aim(self, rotation):
+        # Set the velocity of the shot based on the rotation angle passed in, adding 180 to reverse direction
+        # The vector (0, 1) represents the "forward" direction, then we rotate it to match the player's rotation
+        # and scale it by the PLAYER_SHOOT_SPEED constant to determine how fast it moves.
+        self.velocity.update(0, PLAYER_SHOOT_SPEED)
+        self.velocity.rotate_ip(rotation + 180)
+
+        # A shot never changes direction, so pick its rotated frame once here instead of every draw
         # self.velocity.angle_to(pygame.Vector2(0, -1)) gives the angle between the shot's movement direction
-        rotated_image = pygame.transform.rotate(self.original_image, self.velocity.angle_to(pygame.Vector2(0, -1)))
-        
-        # Create a new rect for the rotated image, centered at the shot's current position
-        rotated_rect = rotated_image.get_rect(center = self.rect.center)
-        
-        # Draw the rotated image on the screen at the updated position
-        screen.blit(rotated_image, rotated_rect)
+        self.image = self.rotations.frame(self.velocity.angle_to(pygame.Vector2(0, -1)))
+
+        # Resize the rectangle (rect) for the rotated image and center it at the shot's position
+        self.rect.size = self.image.get_size()
+        self.rect.center = self.position
+
+    def draw(self, screen, alpha=1.0):
+        # Draw the pre-rotated image on the screen at the shot's current (or interpolated) position
+        # Returns the rect that was drawn over (used by the dirty-rect renderer)
+        rect = self.rect
+        if alpha < 1.0:  # Between two steps: draw part of the way from the previous position
+            rect = self.image.get_rect(center=self.render_position(alpha))
+        return screen.blit(self.image, rect)
 
     def update(self, dt):
         # Update the shot's position by adding the velocity scaled by delta time (dt) for smooth movement
-        self.position += self.velocity * dt
+        # The old Vector2 is kept as the previous position (for interpolated drawing) instead of copying it
+        self.previous_position = self.position
+        self.position = self.position + self.velocity * dt
+        self.age += dt  # Track how long the shot has been alive
         
         # Update the shot's rect position to match the new position
         self.rect.center = self.position
@@ -0,0 +1,62 @@
+import os  # Import os to tell the game's modules apart from library modules
+import sys  # Import sys to find every loaded module
+from contextlib import contextmanager  # Import contextmanager to build the temporary override helper
+import constants  # Import the constants module itself (not a copy of its names)
+
+# Folder holding the game's modules
+GAME_DIR = os.path.dirname(os.path.abspath(constants.__file__))
+
+# Constants that constants.py computes from other constants, in dependency order
+# They are recomputed whenever an override changes their inputs (unless they are overridden themselves)
+DERIVED = {
+    "ASTEROID_MAX_RADIUS": lambda values: values["ASTEROID_MIN_RADIUS"] * values["ASTEROID_KINDS"],
+    "DESPAWN_MARGIN": lambda values: values["ASTEROID_MAX_RADIUS"] * 2,
+    "SWEPT_COLLISION_DISTANCE": lambda values: values["SHOT_RADIUS"] * 2,
+    "SHOT_POOL_SIZE": lambda values: values["MAX_SHOTS"],
+    "ASTEROID_POOL_SIZE": lambda values: values["MAX_ASTEROIDS"],
+}
+
+# Every game module does `from constants import *`, which copies the values into that module,
+# so changing a constant means changing the copy in constants and in every loaded game module
+def game_modules():
+    modules = []
+    for module in list(sys.modules.values()):
+        path = getattr(module, "__file__", None)
+        if path and os.path.dirname(os.path.abspath(path)) == GAME_DIR:
+            modules.append(module)
+    return modules
+
+# Set constants by name in every loaded game module, along with any derived constants that depend on them
+# Returns the previous values (derived ones included) so they can be restored
+def apply_overrides(overrides):
+    overrides = dict(overrides)
+    for name in overrides:
+        if not hasattr(constants, name):
+            raise KeyError(f"unknown constant {name}")
+
+    values = {name: getattr(constants, name) for name in dir(constants) if name.isupper()}
+    values.update(overrides)
+    for name, compute in DERIVED.items():
+        if name not in overrides:
+            value = compute(values)
+            if value != values[name]:
+                overrides[name] = value
+                values[name] = value
+
+    previous = {}
+    modules = game_modules()
+    for name, value in overrides.items():
+        previous[name] = getattr(constants, name)
+        for module in modules:
+            if hasattr(module, name):
+                setattr(module, name, value)
+    return previous
+
+# Use overridden constants inside a `with overridden({...}):` block, then put the old values back
+@contextmanager
+def overridden(overrides):
+    previous = apply_overrides(overrides)
+    try:
+        yield
+    finally:
+        apply_overrides(previous)
@@ -0,0 +1,117 @@
+import hashlib  # Import hashlib to fingerprint the simulation state
+import struct  # Import struct to pack the state into bytes for hashing
+import pygame  # Import pygame for sprite groups
+from constants import *  # Import constants (screen size is used to place the player)
+from player import *  # Import the Player and Shot classes
+from asteroid import *  # Import the Asteroid class
+from asteroidfield import *  # Import the AsteroidField class
+from collision import *  # Import the spatial-hash collision helpers
+from lifetime import cull  # Import the despawn pass for off-screen and expired objects
+from pool import ObjectPool  # Import the recycling pool for shots and asteroids
+from profiler import NullProfiler  # Import the do-nothing profiler used unless one is attached
+
+# World owns the whole game simulation: the sprite groups, the asteroid field, the player and collisions
+# It never touches the display, the mixer or the keyboard, so it can run headless at any speed
+class World:
+
+    # Constructor to set up the sprite groups and create the starting objects
+    def __init__(self):
+        # Create sprite groups for managing different types of objects
+        self.updatable = pygame.sprite.Group()  # Group for objects that need to be updated each step
+        self.drawable = pygame.sprite.Group()  # Group for objects that need to be drawn each frame
+        self.asteroids = pygame.sprite.Group()  # Group for asteroids
+        self.shots = pygame.sprite.Group()  # Group for shots
+
+        # Set up the containers for Asteroid and AsteroidField classes
+        Asteroid.containers = (self.asteroids, self.updatable, self.drawable)
+        AsteroidField.containers = self.updatable
+        self.asteroid_field = AsteroidField()  # Create an AsteroidField object
+
+        # Set up the containers for Player and Shot classes
+        Player.containers = (self.updatable, self.drawable)
+        Shot.containers = (self.shots, self.updatable, self.drawable)
+
+        # Recycle killed shots and asteroids, and build a batch of each before the first step
+        Asteroid.pool = ObjectPool(Asteroid, ASTEROID_POOL_SIZE)
+        Asteroid.pool.prewarm(ASTEROID_POOL_PREWARM, 0, 0, ASTEROID_MIN_RADIUS)
+        Shot.pool = ObjectPool(Shot, SHOT_POOL_SIZE)
+        Shot.pool.prewarm(SHOT_POOL_PREWARM, 0, 0, 0)
+
+        self.player = Player(SCREEN_WIDTH / 2, SCREEN_HEIGHT / 2)  # Create the player at the center of the screen
+
+        self.collision_grid = SpatialHash()  # Broad-phase grid reused every step for player and shot checks
+        self.score = 0  # Number of asteroids hit so far
+        self.frame = 0  # Number of steps simulated so far
+        self.elapsed = 0.0  # Simulated time in seconds
+        self.game_over = False  # Set once an asteroid hits the player
+        self.profiler = NullProfiler()  # Replace with a FrameProfiler to time the update and collision phases
+
+    # Advance the simulation by one step using the given InputState and delta time
+    def step(self, inputs, dt):
+        if self.game_over:  # Nothing moves once the player is dead
+            return
+
+        self.player.controls = inputs  # Hand the controls for this step to the player
+
+        # Update all updatable objects (e.g., player, asteroids, shots)
+        with self.profiler.phase("update"):
+            for obj in self.updatable:
+                obj.update(dt)
+
+        with self.profiler.phase("collision"):
+            # Bucket the asteroids once for both checks, but only when there are shots to query them
+            # (for the player's single query alone, scanning the asteroids is cheaper than building the grid)
+            grid = None
+            if self.shots:
+                grid = self.collision_grid
+                grid.rebuild(self.asteroids)
+
+            # Check for collisions between the player and asteroids
+            if find_player_hit(self.player, self.asteroids, grid):
+                self.game_over = True
+                return
+
+            # Check for collisions between shots and asteroids (each asteroid and shot is resolved once)
+            for asteroid, shot in find_shot_hits(self.asteroids, self.shots, grid):
+                self.score += 1  # Increase the score
+                shot.kill()  # Remove the shot
+                asteroid.split()  # Split the asteroid into smaller pieces
+
+        # Despawn shots and asteroids that left the screen, outlived their lifetime or exceed their group's cap
+        with self.profiler.phase("cull"):
+            cull(self.shots, SHOT_MAX_LIFETIME, MAX_SHOTS)
+            cull(self.asteroids, ASTEROID_MAX_LIFETIME, MAX_ASTEROIDS)
+
+        self.frame += 1
+        self.elapsed += dt
+
+    # Fingerprint of the simulation state (score, player, asteroids and shots) as a 64-bit integer
+    # Two runs with the same seed, inputs and dts must produce the same hash at the same frame
+    def state_hash(self):
+        digest = hashlib.blake2b(digest_size=8)
+        player = self.player
+        digest.update(struct.pack("<qq3d", self.frame, self.score, player.position.x, player.position.y, player.rotation))
+        for group in (self.asteroids, self.shots):
+            for obj in group:
+                digest.update(struct.pack("<5d", obj.position.x, obj.position.y, obj.velocity.x, obj.velocity.y, obj.radius))
+        return int.from_bytes(digest.digest(), "little")
+
+    # Number of live objects in each sprite group (used to check memory stays flat on long runs)
+    def entity_counts(self):
+        return {
+            "updatable": len(self.updatable),
+            "drawable": len(self.drawable),
+            "asteroids": len(self.asteroids),
+            "shots": len(self.shots),
+        }
+
+    # Draw all drawable objects (e.g., player, asteroids, shots) onto the given surface
+    # alpha interpolates between the previous and current step (1.0 draws the current positions)
+    # Returns the list of rects that were drawn over
+    def draw(self, screen, alpha=1.0):
+        rects = []
+        for obj in self.drawable:
+            rect = obj.draw(screen, alpha)
+            if rect:  # Skip objects that drew nothing (or only off screen)
+                rects.append(rect)
+        return rects